@@ -14,6 +14,8 @@ from importlib.metadata import (  # pragma: no cover
 # fmt: on
 from typing import Any, Union
 
+import yaml
+
 try:
     # Change here if project is renamed and does not equal the package name
     dist_name = __name__  # pylint: disable=invalid-name
@@ -53,6 +55,9 @@ CERTDEPLOY_SERVER_LOGGER_NAME = 'certdeploy-server'
 #   https://github.com/paramiko/paramiko/blob/main/paramiko/util.py
 PARAMIKO_LOGGER_NAME = 'paramiko'
 
+# Prefer the libyaml bindings when PyYAML was built with them
+YAMLLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 # Initialize logging ASAP
 logging.basicConfig(
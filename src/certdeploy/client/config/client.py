@@ -1,6 +1,7 @@
 """CertDeploy Client config backends."""
 
 import os
+import re
 import shutil
 from dataclasses import dataclass, field
 from typing import Optional, Union
@@ -13,20 +14,27 @@ from ... import (
     DEFAULT_PORT,
     DEFAULT_USERNAME,
     LogLevel,
+    YAMLLoader,
 )
 from ...errors import ConfigInvalid, ConfigInvalidNumber
 
 # fmt: on
 
 
+# Octal file modes with or without the `0o` prefix (`0o644`, `0644`, `644`)
+_OCTAL_MODE_RE = re.compile(r'\s*(?:0[oO])?([0-7]+)\s*')
+
+
 def _mode_to_int(mode: Union[int, str]) -> int:
     if isinstance(mode, bool):
         return -1
-    if not isinstance(mode, int):
-        try:
-            mode = int(mode, 8)
-        except (TypeError, ValueError):
+    if isinstance(mode, str):
+        match = _OCTAL_MODE_RE.fullmatch(mode)
+        if not match:
             return -1
+        mode = int(match.group(1), 8)
+    elif not isinstance(mode, int):
+        return -1
     if mode > 0 and mode <= 0o777:
         return mode
     return -1
@@ -173,7 +181,7 @@ class Config:
     ):
         """Load the config from a file."""
         with open(filename, 'r', encoding='utf-8') as config_file:
-            config = yaml.safe_load(config_file)
+            config = yaml.load(config_file, Loader=YAMLLoader)
         if 'sftpd' in config:
             if override_sftp_log_level:
                 config['sftpd']['log_level'] = override_sftp_log_level
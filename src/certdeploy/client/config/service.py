@@ -3,6 +3,7 @@
 import os
 import re
 import shutil
+import string
 from typing import Union
 
 from ...errors import ConfigError, ConfigInvalid, ConfigInvalidNumber
@@ -11,12 +12,40 @@ from .. import log
 _DOCKER_NAME_RE = re.compile(r'[a-z0-9_.-]+', flags=re.I)
 _RC_SERVICE_ACTIONS = ('restart', 'reload')
 _SYSTEMCTL_ACTIONS = ('restart', 'reload')
-_SYSTEMD_UNIT_NAME_RE = re.compile(
-    r'[a-z0-9:_,.\\-]+(@[a-z0-9:_,.\\-]+)?\.'
-    r'(service|socket|device|mount|automount|swap|target|path|timer|slice|'
-    r'scope)',
-    flags=re.I,
+_SYSTEMD_UNIT_NAME_CHARS = frozenset(
+    string.ascii_letters + string.digits + ':_,.\\-',
 )
+_SYSTEMD_UNIT_SUFFIXES = frozenset(
+    (
+        'service',
+        'socket',
+        'device',
+        'mount',
+        'automount',
+        'swap',
+        'target',
+        'path',
+        'timer',
+        'slice',
+        'scope',
+    )
+)
+
+
+def _is_systemd_unit_name(name: str) -> bool:
+    """Return `True` if `name` is a valid systemd unit name.
+
+    Valid names look like `<unit>[@<instance>].<suffix>` where `<unit>` and
+    `<instance>` are made up of `_SYSTEMD_UNIT_NAME_CHARS` and `<suffix>` is
+    one of `_SYSTEMD_UNIT_SUFFIXES`.
+    """
+    prefix, _, suffix = name.rpartition('.')
+    if suffix.lower() not in _SYSTEMD_UNIT_SUFFIXES:
+        return False
+    unit, at, instance = prefix.partition('@')
+    if not unit or (at and not instance):
+        return False
+    return _SYSTEMD_UNIT_NAME_CHARS.issuperset(unit + instance)
 
 
 class Service:
@@ -118,13 +147,7 @@ class Service:
 
         """
         try:
-            service_class = {
-                'docker_container': DockerContainer,
-                'docker_service': DockerService,
-                'rc': RCService,
-                'script': Script,
-                'systemd': SystemdUnit,
-            }[config.get('type')]
+            service_class = _SERVICE_TYPES[config.get('type')]
         except KeyError as err:
             raise ConfigError(
                 f'{config.get("type")} is not a valid service ' 'type.'
@@ -155,7 +178,7 @@ class DockerService(Service):
     def _validate_name(self, name: str) -> str:
         if name is None:
             return name
-        if not name or not _DOCKER_NAME_RE.match(name.strip()):
+        if not name or not _DOCKER_NAME_RE.fullmatch(name.strip()):
             raise ConfigInvalid(
                 'name',
                 name,
@@ -233,10 +256,9 @@ class Script(Service):
         super().__init__(config)
         if os.path.isabs(self.name):
             self.script_path = self.name
-        elif shutil.which(self.name):
-            self.script_path = shutil.which(self.name)
         else:
-            self.script_path = os.path.abspath(self.name)
+            script_path = shutil.which(self.name)
+            self.script_path = script_path or os.path.abspath(self.name)
         if not os.path.exists(self.script_path):
             raise ConfigError(
                 f'Script file "{self.script_path}" for service '
@@ -276,8 +298,18 @@ class SystemdUnit(Service):
         )
 
     def _validate_name(self, name: str) -> str:
-        if not name or not _SYSTEMD_UNIT_NAME_RE.match(name.strip()):
+        if not name or not _is_systemd_unit_name(name.strip()):
             raise ConfigInvalid(
                 'name', name, config_desc='systemd update service config'
             )
         return name.strip()
+
+
+# Maps the `type` config value to the service class that loads it.
+_SERVICE_TYPES = {
+    'docker_container': DockerContainer,
+    'docker_service': DockerService,
+    'rc': RCService,
+    'script': Script,
+    'systemd': SystemdUnit,
+}
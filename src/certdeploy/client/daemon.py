@@ -402,8 +402,8 @@ class DeployServer:
                 transport.start_server(server=server)
                 # The channel variable is required for some reason
                 channel = transport.accept()  # noqa: F841
-                while transport.is_active():
-                    time.sleep(1)
+                # The transport is a thread that ends when the session closes
+                transport.join()
             except paramiko.ssh_exception.SSHException as err:
                 if self._config.fail_fast:
                     raise err from err
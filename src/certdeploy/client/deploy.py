@@ -1,7 +1,10 @@
 """CertDeploy Client deploy code."""
 
+import functools
 import glob
+import grp
 import os
+import pwd
 import re
 import shutil
 from typing import Union
@@ -69,6 +72,40 @@ def needs_update(
     return True
 
 
+@functools.lru_cache(maxsize=None)
+def _uid(owner: Union[int, None, str]) -> int:
+    """Return the UID for `owner` or `-1` (unchanged) if it's `None`.
+
+    Raises:
+        LookupError: If `owner` is a username that doesn't exist.
+    """
+    if owner is None:
+        return -1
+    if isinstance(owner, int):
+        return owner
+    try:
+        return pwd.getpwnam(owner).pw_uid
+    except KeyError as err:
+        raise LookupError(f'no such user: {owner!r}') from err
+
+
+@functools.lru_cache(maxsize=None)
+def _gid(group: Union[int, None, str]) -> int:
+    """Return the GID for `group` or `-1` (unchanged) if it's `None`.
+
+    Raises:
+        LookupError: If `group` is a group name that doesn't exist.
+    """
+    if group is None:
+        return -1
+    if isinstance(group, int):
+        return group
+    try:
+        return grp.getgrnam(group).gr_gid
+    except KeyError as err:
+        raise LookupError(f'no such group: {group!r}') from err
+
+
 def _set_permissions(
     path: os.PathLike,
     mode: int,
@@ -82,12 +119,17 @@ def _set_permissions(
         owner,
         group,
     )
-    if mode is not None:
+    if mode is None and owner is None and group is None:
+        return
+    # Only touch what differs from what the file already has
+    stat = os.stat(path)
+    if mode is not None and stat.st_mode & 0o7777 != mode:
         os.chmod(path, mode)
-    if owner is not None:
-        shutil.chown(path, owner)
-    if group is not None:
-        shutil.chown(path, group=group)
+    if owner is not None or group is not None:
+        # Names are resolved once per deploy instead of once per file
+        uid, gid = _uid(owner), _gid(group)
+        if uid not in (-1, stat.st_uid) or gid not in (-1, stat.st_gid):
+            os.chown(path, uid, gid)
 
 
 def deploy(config: ClientConfig) -> bool:
@@ -96,13 +138,22 @@ def deploy(config: ClientConfig) -> bool:
     Returns `True` if new certificates were deployed.
     """
     log.debug('Deploying')
+    # Users and groups can change while the client is running so only reuse
+    #   the resolved names within a single deploy.
+    _uid.cache_clear()
+    _gid.cache_clear()
     update = False
-    if not os.listdir(config.source):
+    # scandir gets the entry types from the directory listing itself so
+    #   checking for lineage directories doesn't need a stat per entry.
+    with os.scandir(config.source) as source_entries:
+        entries = list(source_entries)
+    if not entries:
         log.debug('Source directory is empty: %s', config.source)
         return False
-    for lineage in os.listdir(config.source):
+    for entry in entries:
+        lineage = entry.name
         log.debug('Found lineage: %s', lineage)
-        if not os.path.isdir(os.path.join(config.source, lineage)):
+        if not entry.is_dir():
             continue
         # Do not move invalid key files.
         validate_keys(config.source, lineage)
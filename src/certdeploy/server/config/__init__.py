@@ -6,7 +6,7 @@ from typing import Optional
 
 import yaml
 
-from ... import LogLevel
+from ... import LogLevel, YAMLLoader
 from ...errors import ConfigError
 from .. import log
 from .client import ClientConnection
@@ -37,7 +37,7 @@ class ServerConfig(Server):
             for client_conf in glob.glob(client_conn_glob):
                 print('client conn config file', client_conf)
                 with open(client_conf, 'r', encoding='utf-8') as config_file:
-                    config = yaml.safe_load(config_file)
+                    config = yaml.load(config_file, Loader=YAMLLoader)
                 self.client_configs.append(config)
         if self.client_configs:
             for client_config in self.client_configs:
@@ -79,7 +79,7 @@ class ServerConfig(Server):
                 the config.
         """
         with open(filename, 'r', encoding='utf-8') as config_file:
-            config = yaml.safe_load(config_file)
+            config = yaml.load(config_file, Loader=YAMLLoader)
         if override_sftp_log_level:
             config['sftp_log_level'] = override_sftp_log_level
         if override_sftp_log_filename:
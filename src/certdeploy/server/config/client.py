@@ -78,6 +78,11 @@ class ClientConnection:
 
     Used internally for indexing queues.
     """
+    wanted_files: tuple[str, ...] = field(init=False)
+    """The names of the files from each lineage the client needs. Set on
+    instance creation from `needs_chain`, `needs_fullchain`, and
+    `needs_privkey`.
+    """
 
     def __post_init__(self):
         """Validate configs.
@@ -99,6 +104,15 @@ class ClientConnection:
         self.hash = sha1(
             f'{self.username}{self.address}{self.port}'.encode()
         ).hexdigest()
+        self.wanted_files = tuple(
+            filename
+            for filename, needed in (
+                ('chain.pem', self.needs_chain),
+                ('fullchain.pem', self.needs_fullchain),
+                ('privkey.pem', self.needs_privkey),
+            )
+            if needed
+        )
         # Validate push_retry_interval
         if not is_optional_int(self.push_retry_interval, 0):
             raise ConfigInvalidNumber(
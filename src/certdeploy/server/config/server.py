@@ -177,6 +177,18 @@ class Server:
         seconds.
     * `None` will cause the join to wait indefinitely.
     """
+    connect_timeout: Optional[float] = 5
+    """The number of seconds to wait for each step of connecting to a client.
+    Defaults to 5 seconds.
+
+    This limits opening the TCP connection, waiting for the SSH banner, and
+    authenticating separately. A client that times out is retried like any
+    other failed push.
+
+    * Any positive number (`float` or `int`) will be used as the number of
+        seconds.
+    * `None` will use the `paramiko` defaults.
+    """
     queue_dir: os.PathLike = DEFAULT_SERVER_QUEUE_DIR
     """The directory where runtime files will be stored.
 
@@ -255,6 +267,17 @@ class Server:
                 is_type='float or integer',
                 ge=0,
             )
+        # Check that the connect_timeout is a float or int > 0 if it is set.
+        if not is_optional_float(self.connect_timeout, 0) or (
+            self.connect_timeout == 0
+        ):
+            raise ConfigInvalidNumber(
+                'connect_timeout',
+                self.connect_timeout,
+                is_type='float or integer',
+                optional=True,
+                gt=0,
+            )
         # Check that the renew_every is an integer > 0
         if not is_int(self.renew_every, 1):
             raise ConfigInvalidNumber(
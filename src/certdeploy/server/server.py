@@ -4,8 +4,9 @@ import json
 import os
 import socket
 import time
+from collections import deque
 from datetime import datetime, timedelta
-from threading import Semaphore, Thread
+from threading import Event, Lock, Semaphore, Thread
 from typing import Any, Optional
 
 import paramiko
@@ -23,21 +24,61 @@ from .renew import renew_certs
 ONE_SHOT_TIMEOUT = None  # seconds
 GO_FAST_SLEEP = 0.1  # seconds
 SLOW_DOWN_SLEEP = 30  # seconds
-
-
-def _sftp_mkdir(sftp, path, mode=None):
-    """Recursively make a remote directory (`path`) if needed."""
+WORKER_IDLE_TIMEOUT = 60  # seconds
+# The suffix of the per client queue files.
+_CLIENT_QUEUE_SUFFIX = '.queue.json'
+# The coarsest modification time resolution expected from the filesystem
+#   holding the queue.
+_MTIME_RESOLUTION = 1  # seconds
+
+
+def _sftp_mkdir(sftp, path, mode=None, cache: Optional[set[str]] = None):
+    """Make a remote directory (`path`) and its parents if needed.
+
+    Arguments:
+        sftp: An open SFTP client.
+        path: The remote directory to make.
+        mode: The mode for new directories.
+        cache: A `set` of remote directories known to exist. Directories in it
+            are skipped and directories found or made are added to it.
+            Defaults to `None` (no caching).
+    """
     log.debug('_sftp_mkdir: path=%s, mode=%s', path, mode)
-    if path in ('', '/'):
-        return
     mode = mode if mode is None else 0o700
-    try:
-        sftp.stat(path)
-        return
-    except FileNotFoundError:
-        pass
-    _sftp_mkdir(sftp, os.path.dirname(path), mode)
-    sftp.mkdir(path, mode=mode)
+    # Walk up the path until an existing directory is found.
+    missing = []
+    while path not in ('', '/'):
+        if cache is not None and path in cache:
+            break
+        try:
+            sftp.stat(path)
+        except FileNotFoundError:
+            missing.append(path)
+            path = os.path.dirname(path)
+        else:
+            if cache is not None:
+                cache.add(path)
+            break
+    # Make the missing directories from the top down.
+    for missing_path in reversed(missing):
+        sftp.mkdir(missing_path, mode=mode)
+        if cache is not None:
+            cache.add(missing_path)
+
+
+def _sftp_put(sftp, source: os.PathLike, destination: os.PathLike):
+    """Copy a local file (`source`) to a remote path (`destination`).
+
+    Lineage files are small so the whole file is read at once and sent with a
+    single pipelined write. Unlike `paramiko.SFTPClient.put` this doesn't stat
+    the local file first or the remote file afterwards. Write errors are still
+    raised when the remote file is closed.
+    """
+    with open(source, 'rb') as source_file:
+        data = source_file.read()
+    with sftp.file(destination, 'wb') as destination_file:
+        destination_file.set_pipelined(True)
+        destination_file.write(data)
 
 
 class _TimeoutTimer:
@@ -86,7 +127,12 @@ class _TimeoutTimer:
 
 
 class Queue:
-    """A queue of push jobs."""
+    """A queue of push jobs.
+
+    Each client's lineages are stored in their own file in `queue_dir` so
+    that reading or updating the queue for one client doesn't require parsing
+    or rewriting the queue for every client.
+    """
 
     lock: Semaphore = Semaphore()
     """A lock for writing to the queue file."""
@@ -103,15 +149,31 @@ class Queue:
             The access locking uses lock files to avoid issues with filesystem
                 locks on NFS.
         """
-        self._queue: dict = {}
+        # Client queues are `None` until they are read from disk.
+        self._queue: dict[str, Optional[deque[str]]] = {}
+        # Client hashes of the client queues that need to be written to disk.
+        self._dirty: set[str] = set()
+        self._queue_dir: os.PathLike = server.queue_dir
+        # The single queue file used before the queue was split up by client.
+        #   It's only read to migrate it.
         self._filename: os.PathLike = os.path.join(
             server.queue_dir,
             'queue.json',
         )
-        self._lock_filename = f'{self._filename}.lock'
+        # The lock file is kept in a subdirectory so that locking doesn't
+        #   change the modification time of `queue_dir`.
+        self._lock_dir: os.PathLike = os.path.join(server.queue_dir, '.lock')
+        self._lock_filename: os.PathLike = os.path.join(
+            self._lock_dir,
+            'queue.json.lock',
+        )
         if mode not in ('r', 'w'):
             raise ValueError('`mode` must be either "r" or "w".')
         self._mode: str = mode
+        # The modification time of `queue_dir` and the time it was last
+        #   loaded. Used to skip reloading an unchanged queue.
+        self._loaded_mtime_ns: Optional[int] = None
+        self._loaded_at: float = 0
 
     @property
     def clients(self) -> list[str]:
@@ -126,11 +188,13 @@ class Queue:
                 that needs the update.
             lineage: The lineage path that needs syncing to the client.
         """
-        if client_hash not in self._queue:
-            self._queue[client_hash] = []
-        self._queue[client_hash].append(lineage)
+        client_queue = self._client_queue(client_hash)
+        if client_queue is None:
+            client_queue = self._queue[client_hash] = deque()
+        client_queue.append(lineage)
+        self._dirty.add(client_hash)
 
-    def get(self, client_hash: str, default: Any = None) -> list[str]:
+    def get(self, client_hash: str, default: Any = None) -> deque[str]:
         """Get a list of lineages that need to be pushed to a client.
 
         Arguments:
@@ -140,30 +204,45 @@ class Queue:
                 is found. Defaults to `None`.
 
         Returns:
-            A list of lineages that need to be pushed for the given client.
+            The lineages that need to be pushed for the given client. This is
+            the queue itself, not a copy.
         """
-        client_queue = self._queue.get(client_hash, None)
+        client_queue = self._client_queue(client_hash)
         if client_queue is None:
             return default
-        return (client_queue or []).copy()
+        return client_queue
 
     def count(self, client_hash: str) -> int:
         """Return the number of lineages left to push for the given client."""
-        client_queue = self._queue.get(client_hash)
+        client_queue = self._client_queue(client_hash)
         if not client_queue:
             return 0
         return len(client_queue)
 
     def next(self, client_hash: str) -> str:
         """Return the next lineage to push for the given client."""
-        client_queue = self._queue.get(client_hash)
+        client_queue = self._client_queue(client_hash)
         if not client_queue:
             return None
-        lineage = client_queue.pop(0)
-        if client_hash in self and not self.get(client_hash):
+        lineage = client_queue.popleft()
+        self._dirty.add(client_hash)
+        if not client_queue:
             del self._queue[client_hash]
         return lineage
 
+    def remove(self, client_hash: str, lineage: str):
+        """Remove the first `lineage` queued for the given client.
+
+        Nothing is done if `lineage` isn't queued for the client.
+        """
+        client_queue = self._client_queue(client_hash)
+        if not client_queue or lineage not in client_queue:
+            return
+        client_queue.remove(lineage)
+        self._dirty.add(client_hash)
+        if not client_queue:
+            del self._queue[client_hash]
+
     def load(self):
         """Load the queue from the path configured with `queue_dir`.
 
@@ -178,35 +257,117 @@ class Queue:
         finally:
             self._unlock()
 
+    def _client_filename(self, client_hash: str) -> os.PathLike:
+        """Return the path of the queue file for a client."""
+        return os.path.join(
+            self._queue_dir,
+            f'{client_hash}{_CLIENT_QUEUE_SUFFIX}',
+        )
+
+    def _client_queue(self, client_hash: str) -> Optional[deque[str]]:
+        """Return the queue for a client, reading it from disk if needed.
+
+        Returns:
+            The lineages for the client or `None` if the client isn't in the
+            queue. A client whose queue file was removed since the queue was
+            loaded is treated as not being in the queue.
+        """
+        if client_hash not in self._queue:
+            return None
+        client_queue = self._queue[client_hash]
+        if client_queue is None:
+            try:
+                lineages = self._read(self._client_filename(client_hash), list)
+            except FileNotFoundError:
+                # A writer emptied the client's queue and removed its file
+                #   after this queue was loaded.
+                del self._queue[client_hash]
+                return None
+            client_queue = self._queue[client_hash] = deque(lineages)
+        return client_queue
+
+    @staticmethod
+    def _read(filename: os.PathLike, expected_type: type) -> Any:
+        """Read a queue file.
+
+        Raises:
+            CertDeployError: When the file doesn't contain `expected_type`.
+        """
+        with open(filename, 'r') as queue_file:
+            try:
+                queue = json.load(queue_file)
+            except json.JSONDecodeError as err:
+                raise CertDeployError(
+                    'The queue file contains invalid data.',
+                ) from err
+        if not isinstance(queue, expected_type):
+            raise CertDeployError(
+                'The queue file contains invalid data.',
+            )
+        return queue
+
     def _load(self):
         """Load the queue from disk.
 
-        The backend of `self.load`.
+        The backend of `self.load`. Only the names of the client queue files
+        are read here. The client queues are read as they are needed.
+
+        Readers that are loaded repeatedly skip listing `queue_dir` if it
+        hasn't been modified since the last load. Every change to the queue
+        adds, replaces, or removes a file so it changes the modification time
+        of the directory. The lock file is kept out of `queue_dir` itself so
+        locking doesn't.
         """
+        queue_dir_stat = os.stat(self._queue_dir)
+        if (
+            self._mode == 'r'
+            and queue_dir_stat.st_mtime_ns == self._loaded_mtime_ns
+            # Changes made within the filesystem's timestamp resolution of
+            #   the last load wouldn't change the modification time.
+            and self._loaded_at - queue_dir_stat.st_mtime > _MTIME_RESOLUTION
+        ):
+            return
+        self._loaded_mtime_ns = None
+        self._queue = {}
+        self._dirty = set()
+        for filename in os.listdir(self._queue_dir):
+            if filename.endswith(_CLIENT_QUEUE_SUFFIX):
+                client_hash = filename[: -len(_CLIENT_QUEUE_SUFFIX)]
+                self._queue[client_hash] = None
+        # Merge in the queue file from older versions. It's removed the next
+        #   time the queue is written.
         if os.path.exists(self._filename):
-            with open(self._filename, 'r') as queue_file:
-                try:
-                    queue = json.load(queue_file)
-                except json.JSONDecodeError as err:
-                    raise CertDeployError(
-                        'The queue file contains invalid data.'
-                    ) from err
-                if not isinstance(queue, dict):
-                    raise CertDeployError(
-                        'The queue file contains invalid data.',
-                    )
-            self._queue = queue
+            legacy_queue = self._read(self._filename, dict)
+            for client_hash, lineages in legacy_queue.items():
+                client_queue = self._client_queue(client_hash) or deque()
+                client_queue.extend(lineages)
+                self._queue[client_hash] = client_queue
+                self._dirty.add(client_hash)
         else:
-            self._queue = {}
+            self._loaded_mtime_ns = queue_dir_stat.st_mtime_ns
+            self._loaded_at = time.time()
 
     def _dump(self):
-        """Write the queue to disk."""
-        with open(self._filename, 'w') as queue_file:
-            json.dump(self._queue, queue_file)
+        """Write the changed client queues to disk."""
+        for client_hash in self._dirty:
+            filename = self._client_filename(client_hash)
+            client_queue = self._queue.get(client_hash)
+            if client_queue:
+                # Write to a temporary file and then move it into place so
+                #   readers never see a partially written file.
+                with open(f'{filename}.tmp', 'w') as queue_file:
+                    json.dump(list(client_queue), queue_file)
+                os.replace(f'{filename}.tmp', filename)
+            elif os.path.exists(filename):
+                os.remove(filename)
+        self._dirty = set()
+        if os.path.exists(self._filename):
+            os.remove(self._filename)
 
     def _lock(self):
         """Attempt to lock the queue file for writing."""
         self.lock.acquire()
+        os.makedirs(self._lock_dir, exist_ok=True)
         while os.path.exists(self._lock_filename):
             time.sleep(0.01)
         open(self._lock_filename, 'w').close()
@@ -242,7 +403,11 @@ class PushWorker(Thread):
     """A worker thread to push lineages to a single client."""
 
     def __init__(
-        self, server: 'Server', client: ClientConnection, config: ServerConfig
+        self,
+        server: 'Server',
+        client: ClientConnection,
+        config: ServerConfig,
+        idle_timeout: float = 0,
     ):
         """Prepare the worker.
 
@@ -251,11 +416,25 @@ class PushWorker(Thread):
             client: The client connection information.
             config: The CertDeploy server config for the server creating this
                 worker.
+            idle_timeout: The number of seconds to wait to be woken up by the
+                server once the client's queue is empty. `0` ends the worker as
+                soon as the client's queue is empty. Defaults to `0`.
         """
         Thread.__init__(self, daemon=True)
         self._server = server
         self._client = client
         self._config = config
+        self._idle_timeout = idle_timeout
+        self._stop_event = Event()
+        # Set by the server when more lineages are queued for the client.
+        self._wake_event = Event()
+        # Guards `_closed` so the server can't wake a worker that is ending.
+        self._wake_lock = Lock()
+        self._closed = False
+        # Set while the worker is waiting to be woken up.
+        self._idle = Event()
+        # Reused so an unchanged queue isn't reloaded while waiting.
+        self._queue = Queue(self._config, 'r')
         self._lineage: str = None
         self._retries: int = self._config.push_retries
         # Prefer the client config over the server config.
@@ -267,6 +446,22 @@ class PushWorker(Thread):
             self._retry_interval = self._client.push_retry_interval
         self._exception: Exception = None
         self._attempt: int = None
+        # Remote directories known to exist on the client
+        self._mkdir_cache: set[str] = set()
+        # The client's host key doesn't change so the SSH client is set up
+        #   once and reconnected for each lineage.
+        self._ssh = paramiko.client.SSHClient()
+        if self._client.port == 22:
+            hostkey_name = self._client.address
+        else:
+            hostkey_name = f'[{self._client.address}]:{self._client.port}'
+        self._ssh.get_host_keys().add(
+            hostkey_name,
+            'ssh-ed25519',
+            self._client.pubkey_blob,
+        )
+        # Set the safest policy by default
+        self._ssh.set_missing_host_key_policy(paramiko.client.RejectPolicy)
 
     @property
     def client_hash(self) -> str:
@@ -278,74 +473,121 @@ class PushWorker(Thread):
         """Return `True` if there has been an exception in the thread."""
         return self._exception is not None
 
+    @property
+    def is_idle(self) -> bool:
+        """Return `True` if the worker is waiting to be woken up."""
+        return self._idle.is_set()
+
+    def _open_socket(self) -> socket.socket:
+        """Open a TCP connection to the client tuned for SFTP transfers.
+
+        Raises:
+            NoValidConnectionsError: When the connection fails. This is the
+                same exception `paramiko.SSHClient.connect` raises so that
+                failed connections are retried.
+        """
+        try:
+            sock = socket.create_connection(
+                (self._client.address, self._client.port),
+                timeout=self._config.connect_timeout,
+            )
+        except socket.gaierror:
+            raise
+        except OSError as err:
+            raise NoValidConnectionsError(
+                {(self._client.address, self._client.port): err}
+            ) from err
+        # Don't let Nagle's algorithm hold back the small SFTP requests.
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
     def _sync_client(self):
         """Sync the current lineage to the client over SFTP."""
         cert_dir = os.path.join(
             self._client.path,
             os.path.basename(self._lineage),
         )
-        ssh = paramiko.client.SSHClient()
-        if self._client.port == 22:
-            hostkey_name = self._client.address
-        else:
-            hostkey_name = f'[{self._client.address}]:{self._client.port}'
-        ssh.get_host_keys().add(
-            hostkey_name,
-            'ssh-ed25519',
-            self._client.pubkey_blob,
-        )
-        # Set the safest policy by default
-        ssh.set_missing_host_key_policy(paramiko.client.RejectPolicy)
-        ssh.connect(
-            hostname=self._client.address,
-            port=self._client.port,
-            username=self._client.username,
-            key_filename=self._config.privkey_filename,
-        )
-        sftp = ssh.open_sftp()
-        # Make the destination directory
-        _sftp_mkdir(sftp, cert_dir)
-        # Transfer certificates as needed
-        if self._client.needs_chain:
-            log.debug(
-                'Copying %s to %s',
-                os.path.join(self._lineage, 'chain.pem'),
-                os.path.join(cert_dir, 'chain.pem'),
-            )
-            sftp.put(
-                os.path.join(self._lineage, 'chain.pem'),
-                os.path.join(cert_dir, 'chain.pem'),
-            )
-        if self._client.needs_fullchain:
-            log.debug(
-                'Copying %s to %s',
-                os.path.join(self._lineage, 'fullchain.pem'),
-                os.path.join(cert_dir, 'fullchain.pem'),
-            )
-            sftp.put(
-                os.path.join(self._lineage, 'fullchain.pem'),
-                os.path.join(cert_dir, 'fullchain.pem'),
-            )
-        if self._client.needs_privkey:
-            log.debug(
-                'Copying %s to %s',
-                os.path.join(self._lineage, 'privkey.pem'),
-                os.path.join(cert_dir, 'privkey.pem'),
-            )
-            sftp.put(
-                os.path.join(self._lineage, 'privkey.pem'),
-                os.path.join(cert_dir, 'privkey.pem'),
+        try:
+            self._ssh.connect(
+                hostname=self._client.address,
+                port=self._client.port,
+                username=self._client.username,
+                pkey=self._server.privkey,
+                sock=self._open_socket(),
+                banner_timeout=self._config.connect_timeout,
+                auth_timeout=self._config.connect_timeout,
             )
-        sftp.close()
+            sftp = self._ssh.open_sftp()
+            # Make the destination directory
+            _sftp_mkdir(sftp, cert_dir, cache=self._mkdir_cache)
+            # Transfer certificates as needed
+            for filename in self._client.wanted_files:
+                source = os.path.join(self._lineage, filename)
+                destination = os.path.join(cert_dir, filename)
+                log.debug('Copying %s to %s', source, destination)
+                _sftp_put(sftp, source, destination)
+            sftp.close()
+        finally:
+            # The client deploys the certs once the connection is closed.
+            self._ssh.close()
 
     def _next(self) -> bool:
         """Return `True` if there is another lineage to push.
 
-        This also loads the `self._lineage` variable from the queue.
+        This also loads the `self._lineage` variable from the queue. The
+        lineage is left in the queue until `self._done` is called. Once the
+        client's queue is empty this waits up to the idle timeout to be woken
+        up by the server before checking the queue again.
+        """
+        self._lineage = None
+        while not self._stop_event.is_set():
+            # Clear before reading the queue so a wake up for lineages queued
+            #   after this read isn't missed.
+            self._wake_event.clear()
+            lineages = self._queue.load().get(self._client.hash)
+            if lineages:
+                self._lineage = lineages[0]
+                return True
+            # Don't wait for more work once there is an error to report.
+            if self.has_error or self._idle_timeout <= 0:
+                break
+            self._idle.set()
+            try:
+                if not self._wake_event.wait(self._idle_timeout):
+                    break
+            finally:
+                self._idle.clear()
+        # Anything queued from here on is left for a new worker.
+        with self._wake_lock:
+            self._closed = True
+        return False
+
+    def _done(self):
+        """Remove the current lineage from the queue.
+
+        This is called once the lineage has been pushed or given up on.
         """
         with Queue(self._config, 'w') as queue:
-            self._lineage = queue.next(self._client.hash)
-        return self._lineage is not None
+            queue.remove(self._client.hash, self._lineage)
+
+    def wake(self) -> bool:
+        """Wake the worker to check the queue for more lineages.
+
+        Returns:
+            `False` if the worker has stopped checking the queue.
+        """
+        with self._wake_lock:
+            if self._closed:
+                return False
+            self._idle.clear()
+            self._wake_event.set()
+        return True
+
+    def stop(self):
+        """Stop the worker once it's done with the current lineage."""
+        self._stop_event.set()
+        # Wake the worker if it's waiting.
+        self._wake_event.set()
 
     def run(self):
         """Run the main loop.
@@ -356,12 +598,14 @@ class PushWorker(Thread):
         while self._next():
             log.info('Pushing %s to %s', self._lineage, self._client)
             for self._attempt in range(self._retries + 1):
-                attempt_str = f'{self._attempt + 1}'
-                tries_str = f'{ self._retries + 1 }'
+                # Leave the formatting to the logger so it's skipped when the
+                #   messages aren't logged.
+                attempt_num = self._attempt + 1
+                tries = self._retries + 1
                 log.debug(
                     'Attempt #%s of %s tries.',
-                    attempt_str,
-                    tries_str,
+                    attempt_num,
+                    tries,
                 )
                 try:
                     self._sync_client()
@@ -385,8 +629,8 @@ class PushWorker(Thread):
                         log.warning(
                             'Attempt #%s of %s failed. Not retrying '
                             'sync %s to %s.',  # fmt: skip
-                            attempt_str,
-                            tries_str,
+                            attempt_num,
+                            tries,
                             self._lineage,
                             self._client,
                         )
@@ -394,7 +638,7 @@ class PushWorker(Thread):
                     log.info(
                         'Attempt #%s failed. Retrying sync to %s in '
                         '%s seconds.',  # fmt: skip
-                        attempt_str,
+                        attempt_num,
                         self._client,
                         self._retry_interval,
                     )
@@ -410,15 +654,20 @@ class PushWorker(Thread):
                             format_error(err),
                             exc_info=err,
                         )
+                    self._done()
+                    # Stop checking the queue before ending.
+                    with self._wake_lock:
+                        self._closed = True
                     return  # End the thread
                 else:
                     log.info(
                         'Pushed %s to %s in %s attempts',
                         self._lineage,
                         self._client,
-                        attempt_str,
+                        attempt_num,
                     )
                     break  # Go to the next lineage
+            self._done()
             log.debug('Done pushing %s to %s', self._lineage, self._client)
         log.info('Done pushing all lineages to %s', self._client)
 
@@ -459,8 +708,45 @@ class Server:
         """
         self._config = config
         self._workers: dict[str, PushWorker] = {}
+        # Reused by the main loop so an unchanged queue isn't reloaded.
+        self._queue = Queue(self._config, 'r')
+        # Parsed on first use so queueing lineages doesn't need the key.
+        self._privkey: Optional[paramiko.Ed25519Key] = None
+        # Index the clients by hash so the main loop only has to look at the
+        #   clients that are actually in the queue.
+        self._clients_by_hash: dict[str, ClientConnection] = {
+            client.hash: client for client in self._config.clients
+        }
+        # The position of each client in the config. The queue doesn't keep
+        #   the order clients were added in so this is used to push to the
+        #   clients in the order they are configured.
+        self._client_order: dict[str, int] = {
+            client_hash: index
+            for index, client_hash in enumerate(self._clients_by_hash)
+        }
         self._schedule_renew()
 
+    @property
+    def privkey(self) -> paramiko.Ed25519Key:
+        """The server's parsed private key.
+
+        The key is parsed once instead of on every connection.
+
+        Raises:
+            ConfigError: When the key can't be read or parsed.
+        """
+        if self._privkey is None:
+            try:
+                self._privkey = paramiko.Ed25519Key.from_private_key_file(
+                    self._config.privkey_filename
+                )
+            except (OSError, SSHException) as err:
+                raise ConfigError(
+                    'Invalid `privkey_filename` value: '
+                    f'{self._config.privkey_filename}: {err}'
+                ) from err
+        return self._privkey
+
     def serve_forever(self, one_shot: bool = False):
         """Push queued lineages to clients.
 
@@ -474,51 +760,56 @@ class Server:
         #   if it takes too long. In order to use it set `ONE_SHOT_TIMEOUT`
         #   to a positive integer.
         timeout = _TimeoutTimer.start(ONE_SHOT_TIMEOUT)
+        # Keep parallel workers around for a while after their queue empties
+        #   so they can be reused. Serial pushes wait for each worker to end
+        #   and one shot runs end when the workers end so those don't wait.
+        idle_timeout = WORKER_IDLE_TIMEOUT
+        if one_shot or self._config.push_mode == PushMode.SERIAL:
+            idle_timeout = 0
         while not self._stop_running:
             main_loop_sleep = GO_FAST_SLEEP
-            queue = Queue(self._config, 'r').load()
+            queue = self._queue.load()
             log.debug(
                 'Queue length is %s, worker count is %s',
                 len(queue),
                 len(self._workers),
             )
-            if len(queue) < 1 and len(self._workers) < 1:
-                # Slow down when the queue is empty and there are no workers.
+            busy_workers = [w for w in self._workers.values() if not w.is_idle]
+            if len(queue) < 1 and len(busy_workers) < 1:
+                # Slow down when the queue is empty and no workers are busy.
                 main_loop_sleep = SLOW_DOWN_SLEEP
                 if one_shot:
                     # Once the queue is empty and there are no more workers,
                     #   all the jobs sent with the push only option have
                     #   completed and this loop doesn't need to run anymore.
                     return
-            for client in self._config.clients:
-                if client.hash not in queue:
+            queued_hashes = sorted(
+                (h for h in queue.clients if h in self._clients_by_hash),
+                key=self._client_order.get,
+            )
+            for client_hash in queued_hashes:
+                client = self._clients_by_hash[client_hash]
+                if not self._wake_or_add_worker(client, idle_timeout):
+                    # The client's worker is busy and will push these next.
                     continue
-                if client.hash not in self._workers:
+                if self._config.push_mode == PushMode.SERIAL:
                     log.debug(
-                        'Adding worker for %s@%s:%s',
+                        'Waiting for push to %s@%s:%s to finish',
                         client.username,
                         client.address,
                         client.port,
                     )
-                    self._add_worker(client)
-                    if self._config.push_mode == PushMode.SERIAL:
-                        log.debug(
-                            'Waiting for push to %s@%s:%s to finish',
-                            client.username,
-                            client.address,
-                            client.port,
-                        )
-                        self._workers[client.hash].join(
-                            self._config.join_timeout,
-                        )
-                        log.debug(
-                            'Finished pushing to %s@%s:%s',
-                            client.username,
-                            client.address,
-                            client.port,
-                        )
-                    # Only delay when adding a new worker
-                    time.sleep(self._config.push_interval)
+                    self._workers[client.hash].join(
+                        self._config.join_timeout,
+                    )
+                    log.debug(
+                        'Finished pushing to %s@%s:%s',
+                        client.username,
+                        client.address,
+                        client.port,
+                    )
+                # Only delay when a worker starts pushing
+                time.sleep(self._config.push_interval)
             # Cleanup workers if idle
             for worker in list(self._workers.values()):
                 if not worker.is_alive():
@@ -531,6 +822,8 @@ class Server:
                 timeout.check()
             # End just for debugging
             time.sleep(main_loop_sleep)
+        for worker in self._workers.values():
+            worker.stop()
         log.debug('Done serving')
 
     def sync(self, lineage: os.PathLike, domains: list[str]):
@@ -553,16 +846,48 @@ class Server:
                         )
                     break
 
-    def _add_worker(self, client: ClientConnection):
+    def _add_worker(self, client: ClientConnection, idle_timeout: float = 0):
         """Kickstart a new `PushWorker` for `client`."""
-        worker = PushWorker(self, client, self._config)
+        worker = PushWorker(self, client, self._config, idle_timeout)
         self._workers[client.hash] = worker
         worker.start()
 
+    def _wake_or_add_worker(
+        self,
+        client: ClientConnection,
+        idle_timeout: float = 0,
+    ) -> bool:
+        """Get the worker for `client` to push the client's queued lineages.
+
+        An idle worker is woken up. A new worker is started if `client` doesn't
+        have one or its worker has stopped checking the queue.
+
+        Returns:
+            `True` if a worker was started or woken up. `False` if the worker
+            is busy and will get to the lineages on its own.
+        """
+        worker = self._workers.get(client.hash)
+        if worker is not None:
+            was_idle = worker.is_idle
+            if worker.wake():
+                return was_idle
+            # The worker is ending so replace it.
+            self._remove_worker(worker)
+        log.debug(
+            'Adding worker for %s@%s:%s',
+            client.username,
+            client.address,
+            client.port,
+        )
+        self._add_worker(client, idle_timeout)
+        return True
+
     def _remove_worker(self, worker):
         """End `worker` and pop it out of the pool."""
-        worker.join(self._config.join_timeout)
-        del self._workers[worker.client_hash]
+        try:
+            worker.join(self._config.join_timeout)
+        finally:
+            del self._workers[worker.client_hash]
 
     def _schedule_renew(self):
         """Attempt to configure a scheduled cert renewal.
@@ -20,8 +20,9 @@ def test_accepts_valid_action_reload(
         ]
     )
     config = ClientConfig.load(config_filename)
-    assert config.services[0].name == name
-    assert config.services[0].action == action
+    (service,) = config.services
+    assert service.name == name
+    assert service.action == action
 
 
 def test_accepts_valid_action_restart(
@@ -36,8 +37,9 @@ def test_accepts_valid_action_restart(
         ]
     )
     config = ClientConfig.load(config_filename)
-    assert config.services[0].name == name
-    assert config.services[0].action == action
+    (service,) = config.services
+    assert service.name == name
+    assert service.action == action
 
 
 def test_accepts_valid_action_none(
@@ -56,8 +58,9 @@ def test_accepts_valid_action_none(
         ]
     )
     config = ClientConfig.load(config_filename)
-    assert config.services[0].name == name
-    assert config.services[0].action == SystemdUnit.action
+    (service,) = config.services
+    assert service.name == name
+    assert service.action == SystemdUnit.action
 
 
 def test_accepts_valid_action_empty(
@@ -76,5 +79,6 @@ def test_accepts_valid_action_empty(
         ]
     )
     config = ClientConfig.load(config_filename)
-    assert config.services[0].name == name
-    assert config.services[0].action == SystemdUnit.action
+    (service,) = config.services
+    assert service.name == name
+    assert service.action == SystemdUnit.action
@@ -1,5 +1,6 @@
 """Tests to verify the behavior of the systemd service update type."""
 
+import re
 from typing import Callable
 
 import pytest
@@ -9,46 +10,61 @@ from fixtures.utils import ConfigContext
 from certdeploy.client.config import ClientConfig
 from certdeploy.errors import ConfigError
 
+NAME_CONFIG_DESC = 'systemd update service config'
+NULL_NAME_ERROR_RE = re.compile(
+    re.escape(
+        ClientErrors.format_invalid_value('name', 'None', NAME_CONFIG_DESC),
+    )
+)
+# In the order Systemd lists them
+SYSTEMD_UNIT_SUFFIXES = (
+    'service',
+    'socket',
+    'device',
+    'mount',
+    'automount',
+    'swap',
+    'target',
+    'path',
+    'timer',
+    'slice',
+    'scope',
+)
+
 
 def test_accepts_valid_name(
     tmp_client_config_file: Callable[[...], ConfigContext],
-    tmp_path_factory: pytest.TempPathFactory,
 ):
     """Verify the valid values for the `systemd` are accepted."""
     names = [
         'a-z0-9:_,.\\-@a-z0-9:_,.\\-.service',
         'a-z0-9:_,.\\-.service',
+        're-test@sD0:_\\,c.service',
+        're-testD0:_\\,c.socket',
         'a_unit_name.service',
-        'a_unit_name.socket',
-        'a_unit_name.device',
-        'a_unit_name.mount',
-        'a_unit_name.automount',
-        'a_unit_name.swap',
-        'a_unit_name.target',
-        'a_unit_name.path',
-        'a_unit_name.timer',
-        'a_unit_name.slice',
-        'a_unit_name.scope',
     ]
-    for name in names:
-        context = tmp_client_config_file(
-            tmp_path=tmp_path_factory.mktemp('test_accepts_valid_name'),
-            update_services=[dict(type='systemd', name=name)],
-        )
-        config = ClientConfig.load(context.config_path)
-        assert config.services[0].name == name
+    context = tmp_client_config_file(
+        update_services=[dict(type='systemd', name=name) for name in names],
+    )
+    config = ClientConfig.load(context.config_path)
+    assert [service.name for service in config.services] == names
 
 
-def test_fails_invalid_name_values(
-    tmp_client_config_file: Callable[[...], ConfigContext],
-    tmp_path_factory: pytest.TempPathFactory,
+@pytest.mark.parametrize('suffix', SYSTEMD_UNIT_SUFFIXES)
+def test_accepts_valid_name_suffix(
+    suffix: str, client_config_from_dict: Callable[..., ClientConfig]
 ):
-    """Verify ConfigError is thrown for `name` values that are invalid.
+    """Verify a unit name with each of the valid suffixes is accepted."""
+    name = f'a_unit_name.{suffix}'
+    service_config = dict(type='systemd', name=name)
+    config = client_config_from_dict(update_services=[service_config])
+    (service,) = config.services
+    assert service.name == name
 
-    This is an exhaustive set of invalid names but these are important when it
-    comes to shell injection.
-    """
-    bad_names = [
+
+@pytest.mark.parametrize(
+    'bad_name',
+    [
         'with spaces.service',
         'bad_extension.svc',
         'bad_character_;.service',
@@ -59,17 +75,27 @@ def test_fails_invalid_name_values(
         'bad_character_|.service',
         'bad_character_+.service',
         'bad_character_*.service',
-    ]
-    for bad_name in bad_names:
-        context = tmp_client_config_file(
-            tmp_path=tmp_path_factory.mktemp('test_fails_invalid_name_values'),
-            update_services=[dict(type='systemd', name=bad_name)],
-        )
-        with pytest.raises(ConfigError) as err:
-            ClientConfig.load(context.config_path)
-        assert ClientErrors.format_invalid_value(
-            'name', bad_name, 'systemd update service config'
-        ) in str(err)
+        'trailing_characters.service;ls',
+    ],
+)
+def test_fails_invalid_name_values(
+    bad_name: str, tmp_client_config_file: Callable[[...], ConfigContext]
+):
+    """Verify ConfigError is thrown for `name` values that are invalid.
+
+    This is an exhaustive set of invalid names but these are important when it
+    comes to shell injection.
+    """
+    context = tmp_client_config_file(
+        update_services=[dict(type='systemd', name=bad_name)],
+    )
+    expected = ClientErrors.format_invalid_value(
+        'name',
+        bad_name,
+        NAME_CONFIG_DESC,
+    )
+    with pytest.raises(ConfigError, match=re.escape(expected)):
+        ClientConfig.load(context.config_path)
 
 
 def test_fails_null_name_values(
@@ -79,11 +105,8 @@ def test_fails_null_name_values(
     context = tmp_client_config_file(
         update_services=[dict(type='systemd', name=None)],
     )
-    with pytest.raises(ConfigError) as err:
+    with pytest.raises(ConfigError, match=NULL_NAME_ERROR_RE):
         ClientConfig.load(context.config_path)
-    assert ClientErrors.format_invalid_value(
-        'name', 'None', 'systemd update service config'
-    ) in str(err)
 
 
 def test_fails_missing_name_values(
@@ -91,8 +114,5 @@ def test_fails_missing_name_values(
 ):
     """Verify ConfigError is thrown for `name` values that are missing."""
     context = tmp_client_config_file(update_services=[dict(type='systemd')])
-    with pytest.raises(ConfigError) as err:
+    with pytest.raises(ConfigError, match=NULL_NAME_ERROR_RE):
         ClientConfig.load(context.config_path)
-    assert ClientErrors.format_invalid_value(
-        'name', 'None', 'systemd update service config'
-    ) in str(err)
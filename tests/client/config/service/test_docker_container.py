@@ -1,50 +1,79 @@
 """Verify the `DockerContainer` service type is parsed correctly."""
 
+import re
 from typing import Callable
 
+import pytest
+from fixtures.errors import ClientErrors
 from fixtures.utils import ConfigContext
 
 from certdeploy.client.config import ClientConfig
 from certdeploy.client.config.service import DockerContainer
+from certdeploy.errors import ConfigError
 
+_CONTAINER_NAME = 're-test_container.8'
+_FILTER_NAME = 'filter_name'
 
-def test_accepts_and_transforms_valid_name(
-    tmp_client_config_file: Callable[[...], ConfigContext]
-):
-    """Verify the `docker_container` update service type `name` is parsed.
 
-    Valid values for `docker_container` are accepted and `name` is converted to
-    the `filters`.
-    """
-    container_name = 're-test_container.8'
+@pytest.fixture(scope='module')
+def ref_container() -> DockerContainer:
+    """Return a reference `DockerContainer` selected by name."""
+    return DockerContainer(dict(name=_CONTAINER_NAME))
+
+
+@pytest.fixture(scope='module')
+def ref_container_filtered() -> DockerContainer:
+    """Return a reference `DockerContainer` selected by filters."""
+    return DockerContainer(dict(filters={'name': _FILTER_NAME}))
+
+
+def test_loads_docker_container(
+    tmp_client_config_file: Callable[[...], ConfigContext],
+    ref_container: DockerContainer,
+):
+    """Verify the `docker_container` update service type is loaded."""
     context = tmp_client_config_file(
         update_services=[
-            dict(type='docker_container', name=container_name),
+            dict(type='docker_container', name=_CONTAINER_NAME),
         ]
     )
     config = ClientConfig.load(context.config_path)
-    ref_service = DockerContainer(dict(name=container_name))
-    assert ref_service in config.services
-    service = config.services[config.services.index(ref_service)]
-    assert service.filters['name'] == f'^{container_name}$'
+    assert config.services == [ref_container]
+
+
+def test_accepts_and_transforms_valid_name(ref_container: DockerContainer):
+    """Verify the `docker_container` update service type `name` is parsed.
+
+    Valid values for `docker_container` are accepted and `name` is converted to
+    the `filters`.
+    """
+    assert ref_container.filters['name'] == f'^{_CONTAINER_NAME}$'
 
 
 def test_config_update_services_docker_container_filters(
-    tmp_client_config_file: Callable[[...], ConfigContext]
+    ref_container_filtered: DockerContainer,
 ):
     """Verify the `docker_container` update service type `filters` is parsed.
 
     Valid values for the `docker_container` update service type
     are accepted and the filters are transferred correctly.
     """
-    filter_name = 'filter_name'
-    context = tmp_client_config_file(
-        update_services=[
-            dict(type='docker_container', filters={'name': filter_name}),
-        ]
-    )
-    config = ClientConfig.load(context.config_path)
-    ref_service = DockerContainer(dict(filters={'name': filter_name}))
-    assert ref_service in config.services
-    service = config.services[config.services.index(ref_service)]
-    assert service.filters['name'] == filter_name
+    assert ref_container_filtered.filters['name'] == _FILTER_NAME
+
+
+def test_fails_invalid_name_values():
+    """Verify ConfigError is thrown for `name` values that are invalid.
+
+    Characters outside the allowed set anywhere in the name are rejected, not
+    just at the start.
+    """
+    bad_name = 're-test_container;ls'
+    with pytest.raises(
+        ConfigError,
+        match=re.escape(
+            ClientErrors.format_invalid_value(
+                'name', bad_name, 'docker container config'
+            )
+        ),
+    ):
+        DockerContainer(dict(name=bad_name))
@@ -8,46 +8,58 @@ from fixtures.utils import ConfigContext
 from certdeploy.client.config import ClientConfig
 from certdeploy.client.config.service import DockerService
 
+_SERVICE_NAME = 're-test_container.8'
+_FILTER_NAME = 'filter_name'
+
+
+@pytest.fixture(scope='module')
+def ref_service() -> DockerService:
+    """Return a reference `DockerService` selected by name."""
+    return DockerService(dict(name=_SERVICE_NAME))
+
+
+@pytest.fixture(scope='module')
+def ref_service_filtered() -> DockerService:
+    """Return a reference `DockerService` selected by filters."""
+    return DockerService(dict(filters={'name': _FILTER_NAME}))
+
 
 @pytest.mark.skip(reason='broken by https://github.com/moby/moby/issues/46341')
 def test_accepts_and_transforms_valid_name(
-    tmp_client_config_file: Callable[[...], ConfigContext]
+    tmp_client_config_file: Callable[[...], ConfigContext],
+    ref_service: DockerService,
 ):
     """Verify the `docker_service` update service type `name` is parsed.
 
     Valid values for the `docker_service` update service type are accepted and
     `name` is converted to the `filters`.
     """
-    service_name = 're-test_container.8'
     config_filename, _ = tmp_client_config_file(
         update_services=[
-            dict(type='docker_service', name=service_name),
+            dict(type='docker_service', name=_SERVICE_NAME),
         ]
     )
     config = ClientConfig.load(config_filename)
-    ref_service = DockerService(dict(name=service_name))
-    assert ref_service in config.services
-    service = config.services[config.services.index(ref_service)]
-    assert service.filters['name'] == f'^{service_name}$'
+    (service,) = config.services
+    assert service == ref_service
+    assert service.filters['name'] == f'^{_SERVICE_NAME}$'
 
 
 def test_accepts_valid_filters(
     tmp_client_config_file: Callable[[...], ConfigContext],
+    ref_service_filtered: DockerService,
 ):
     """Verify the `docker_service` update service type `name` is parsed.
 
     Valid values for the `docker_service` update service type are accepted and
     the filters are transferred correctly.
     """
-    filter_name = 'filter_name'
     config_filename, _ = tmp_client_config_file(
-        # In the order Systemd lists them
         update_services=[
-            dict(type='docker_service', filters={'name': filter_name}),
+            dict(type='docker_service', filters={'name': _FILTER_NAME}),
         ]
     )
     config = ClientConfig.load(config_filename)
-    ref_service = DockerService(dict(filters={'name': filter_name}))
-    assert ref_service in config.services
-    test_service = config.services[config.services.index(ref_service)]
-    assert test_service.filters['name'] == filter_name
+    (test_service,) = config.services
+    assert test_service == ref_service_filtered
+    assert test_service.filters['name'] == _FILTER_NAME
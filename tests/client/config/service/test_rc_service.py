@@ -25,32 +25,30 @@ def test_fails_null_name_values(
 
 
 def test_fails_missing_name_values(
-    tmp_client_config_file: Callable[[...], ConfigContext]
+    client_config_from_dict: Callable[..., ClientConfig]
 ):
     """Verify ConfigError is thrown for `name` values that are missing."""
-    context = tmp_client_config_file(update_services=[dict(type='rc')])
     with pytest.raises(ConfigError) as err:
-        ClientConfig.load(context.config_path)
+        client_config_from_dict(update_services=[dict(type='rc')])
     assert ClientErrors.format_invalid_value(
         'name', 'None', 'rc service update config'
     ) in str(err)
 
 
 def test_fails_invalid_action_value(
-    tmp_client_config_file: Callable[[...], ConfigContext],
+    client_config_from_dict: Callable[..., ClientConfig]
 ):
     """Verify ConfigError is thrown for invalid `action` values."""
-    context = tmp_client_config_file(
-        update_services=[
-            dict(
-                type='rc',
-                name='valid-name',
-                action='invalid action',
-            )
-        ],
-    )
     with pytest.raises(ConfigError) as err:
-        ClientConfig.load(context.config_path)
+        client_config_from_dict(
+            update_services=[
+                dict(
+                    type='rc',
+                    name='valid-name',
+                    action='invalid action',
+                )
+            ],
+        )
     assert ClientErrors.format_invalid_value(
         key='action', value='invalid action', config_desc='service valid-name'
     ) in str(err)
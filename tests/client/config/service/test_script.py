@@ -30,14 +30,15 @@ def test_accepts_absolute_name_values(
     )
     config = ClientConfig.load(context.config_path)
     ref_service = Script(dict(name=str(script.absolute())))
-    assert ref_service in config.services
-    test_service = config.services[config.services.index(ref_service)]
+    (test_service,) = config.services
+    assert test_service == ref_service
     assert test_service.script_path == ref_service.script_path
 
 
 def test_accepts_relative_name_values(
     tmp_client_config_file: Callable[[...], ConfigContext],
     tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
 ):
     """Verify the `script` update service type `name` is parsed.
 
@@ -46,8 +47,7 @@ def test_accepts_relative_name_values(
     """
     script = tmp_path.joinpath('__this_is_a_test_script.sh')
     script.write_text('')
-    cwd = os.curdir
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
     assert not shutil.which(
         script.name
     ), f'{script.name} is in PATH so this test is ambiguous'
@@ -56,9 +56,8 @@ def test_accepts_relative_name_values(
     )
     config = ClientConfig.load(context.config_path)
     ref_service = Script(dict(name=script.name))
-    os.chdir(cwd)
-    assert ref_service in config.services
-    test_service = config.services[config.services.index(ref_service)]
+    (test_service,) = config.services
+    assert test_service == ref_service
     assert test_service.script_path == str(script.absolute())
 
 
@@ -79,8 +78,8 @@ def test_accepts_valid_name_values(
     )
     config = ClientConfig.load(config_filename)
     ref_service = Script(dict(name='true'))
-    assert ref_service in config.services
-    test_service = config.services[config.services.index(ref_service)]
+    (test_service,) = config.services
+    assert test_service == ref_service
     assert test_service.script_path == true_exec_path
 
 
@@ -94,9 +93,10 @@ def test_fails_invalid_name_values(
     """
     script_name = '__certdeploy_test_script_that_does_not_exist'
     ## Verify the script is not in the current directory
+    cwd = os.getcwd()
     assert not os.path.exists(
         script_name
-    ), f'There is cruft "{script_name}" in the temp directory "{os.curdir}".'
+    ), f'There is cruft "{script_name}" in the working directory "{cwd}".'
     ## Verify the script is not in the PATH
     assert not shutil.which(
         script_name
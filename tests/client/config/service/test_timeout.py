@@ -0,0 +1,48 @@
+"""Verify the update service `timeout` config is parsed correctly."""
+
+from typing import Callable, Union
+
+import pytest
+
+from certdeploy.client.config import ClientConfig
+from certdeploy.client.config.service import DockerContainer
+
+# Each case only differs from these by the `timeout` option
+SYSTEMD_SERVICE = dict(type='systemd', name='timeout-test.service')
+RC_SERVICE = dict(type='rc', name='timeout-test')
+DOCKER_CONTAINER = dict(type='docker_container', name='timeout-test')
+
+
+@pytest.mark.parametrize(
+    'service_config, expected',
+    [
+        (dict(SYSTEMD_SERVICE, timeout=91), 91),
+        (dict(SYSTEMD_SERVICE, timeout=9.1), 9.1),
+        (dict(RC_SERVICE, timeout=11), 11),
+        (RC_SERVICE, None),
+        (DOCKER_CONTAINER, DockerContainer.timeout),
+        (dict(DOCKER_CONTAINER, timeout=None), DockerContainer.timeout),
+        (dict(DOCKER_CONTAINER, timeout=91), 91),
+    ],
+    ids=[
+        'int',
+        'float',
+        'rc_int',
+        'rc_default',
+        'docker_default',
+        'docker_none_gets_default',
+        'docker_int_overrides_default',
+    ],
+)
+def test_timeout(
+    service_config: dict,
+    expected: Union[float, int, None],
+    client_config_from_dict: Callable[..., ClientConfig],
+):
+    """Verify valid `timeout` values are accepted and defaults are applied.
+
+    An omitted or `None` `timeout` gets the service type's default.
+    """
+    config = client_config_from_dict(update_services=[service_config])
+    (service,) = config.services
+    assert service.timeout == expected
@@ -20,7 +20,6 @@ from certdeploy.client.daemon import DeployServer
 
 def test_logs_at_given_level_to_given_file(
     managed_thread: Callable[[...], CleanThread],
-    wait_for_condition: Callable[[Callable[[], bool], int], None],
     tmp_client_config: Callable[[...], ClientConfig],
     tmp_path: pathlib.Path,
 ):
@@ -52,9 +51,7 @@ def test_logs_at_given_level_to_given_file(
         kill_switch=kill_switch,
         teardown=kill_switch.teardown(client),
     )
-    client_thread.wait_for_text_in_log(
-        RefMsgs.HAS_STARTED.log, lambda _: log_path.read_bytes()
-    )
+    client_thread.wait_for_text_in_file(RefMsgs.HAS_STARTED.log, log_path)
     client_thread.reraise_unexpected()
     ## Formally verify results
     assert (
@@ -67,7 +64,6 @@ def test_logs_at_given_level_to_given_file(
 
 def test_sftpd_logs_at_given_level_to_given_file(
     managed_thread: Callable[[...], CleanThread],
-    wait_for_condition: Callable[[Callable[[], bool], int], None],
     keypairgen: Callable[[...], KeyPair],
     mock_server_push: Callable[[...], MockPushContext],
     tmp_client_config: Callable[[...], ClientConfig],
@@ -116,8 +112,9 @@ def test_sftpd_logs_at_given_level_to_given_file(
         kill_switch=kill_switch,
         teardown=kill_switch.teardown(client),
     )
-    client_thread.wait_for_text_in_log(
-        RefMsgs.HAS_STARTED.log, lambda x: client_log_path.read_bytes()
+    client_thread.wait_for_text_in_file(
+        RefMsgs.HAS_STARTED.log,
+        client_log_path,
     )
     assert (
         client_thread.is_alive() is True
@@ -130,5 +127,7 @@ def test_sftpd_logs_at_given_level_to_given_file(
     paramiko_log = logging.getLogger(name=PARAMIKO_LOGGER_NAME)
     assert LogLevel.cast(paramiko_log.getEffectiveLevel()) == log_level
     assert paramiko_log.handlers[0].stream.name == str(log_path)
-    assert ParamikoRefMsgs.TRANSPORT_EMPTY.log in log_path.read_bytes()
-    assert ParamikoRefMsgs.TRANSPORT_SFTP_EMPTY.log in log_path.read_bytes()
+    # The push has finished by now so the log only needs reading once
+    paramiko_log_text = log_path.read_bytes()
+    assert ParamikoRefMsgs.TRANSPORT_EMPTY.log in paramiko_log_text
+    assert ParamikoRefMsgs.TRANSPORT_SFTP_EMPTY.log in paramiko_log_text
@@ -10,6 +10,7 @@ def test_permissions_mode_valid():
     assert _mode_to_int('0777') == 511
     assert _mode_to_int('777') == 511
     assert _mode_to_int('1') == 1
+    assert _mode_to_int('0O644') == 420
 
 
 def test_permissions_mode_invalid():
@@ -19,3 +20,6 @@ def test_permissions_mode_invalid():
     assert _mode_to_int(True) < 0
     assert _mode_to_int(None) < 0
     assert _mode_to_int('') < 0
+    assert _mode_to_int('0o') < 0
+    assert _mode_to_int('0x1ff') < 0
+    assert _mode_to_int('-7') < 0
@@ -0,0 +1,64 @@
+"""Tests for resolving user and group names once per deploy."""
+
+import grp
+import os
+import pathlib
+import pwd
+import shutil
+from types import SimpleNamespace
+from typing import Callable
+
+import pytest
+
+from certdeploy.client.config import ClientConfig
+from certdeploy.client.deploy import deploy
+
+LINEAGE_NAME = 'lineage.test'
+NAME = 'certdeploy-test'
+
+
+def test_deploy_picks_up_changed_owner_and_group(
+    lineage_factory: Callable[[str, list[str]], pathlib.Path],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_client_config: Callable[..., ClientConfig],
+):
+    """Verify a user or group changed between deploys is picked up."""
+    ## Define some variables to avoid magic values
+    # IDs that won't match the owner and group of the test files
+    old_ids = (4000, 4001)
+    new_ids = (5000, 5001)
+    ## Setup test
+    ids = dict(uid=old_ids[0], gid=old_ids[1])
+    monkeypatch.setattr(
+        pwd,
+        'getpwnam',
+        lambda name: SimpleNamespace(pw_uid=ids['uid']),
+    )
+    monkeypatch.setattr(
+        grp,
+        'getgrnam',
+        lambda name: SimpleNamespace(gr_gid=ids['gid']),
+    )
+    chowns = []
+    monkeypatch.setattr(
+        os,
+        'chown',
+        lambda path, uid, gid: chowns.append((uid, gid)),
+    )
+    config = tmp_client_config(file_permissions=dict(owner=NAME, group=NAME))
+    lineage = lineage_factory(LINEAGE_NAME)
+    source_lineage = os.path.join(config.source, LINEAGE_NAME)
+    ## Run test
+    shutil.copytree(lineage, source_lineage)
+    deploy(config)
+    first_chowns = list(chowns)
+    chowns.clear()
+    ## Change the user and group out from under the client
+    ids.update(uid=new_ids[0], gid=new_ids[1])
+    shutil.copytree(lineage, source_lineage, dirs_exist_ok=True)
+    deploy(config)
+    ## Verify the results
+    assert first_chowns
+    assert set(first_chowns) == {old_ids}
+    assert chowns
+    assert set(chowns) == {new_ids}
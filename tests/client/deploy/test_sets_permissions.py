@@ -35,39 +35,78 @@ def test_sets_mode_when_given(tmp_path: pathlib.Path):
     assert mode_after == stat_after.st_mode
 
 
-def test_tries_set_owner_when_given(tmp_path: pathlib.Path):
+def test_matching_permissions_leave_file_untouched(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: pathlib.Path,
+):
+    """Verify a file that already has the given permissions isn't changed."""
     test_file = tmp_path.joinpath('test.pem')
     test_file.write_text('')
-    # First try to set the owner to the current user (aka current owner)
-    #  This should be a noop and won't error out.
+    os.chmod(test_file.absolute(), 0o644)
     stat_before = test_file.stat()
-    _set_permissions(test_file.absolute(), None, stat_before.st_uid, None)
+    calls = []
+    monkeypatch.setattr(os, 'chmod', lambda *args: calls.append(args))
+    monkeypatch.setattr(os, 'chown', lambda *args: calls.append(args))
+    _set_permissions(
+        test_file.absolute(),
+        0o644,
+        stat_before.st_uid,
+        stat_before.st_gid,
+    )
+    assert calls == []
+
+
+def test_sets_differing_mode_with_matching_owner_and_group(
+    tmp_path: pathlib.Path,
+):
+    """Verify a differing mode is set when the owner and group match."""
+    test_file = tmp_path.joinpath('test.pem')
+    test_file.write_text('')
+    os.chmod(test_file.absolute(), 0o666)
+    stat_before = test_file.stat()
+    _set_permissions(
+        test_file.absolute(),
+        0o640,
+        stat_before.st_uid,
+        stat_before.st_gid,
+    )
     stat_after = test_file.stat()
-    assert stat_before.st_gid == stat_after.st_gid
+    assert stat_after.st_mode & 0o7777 == 0o640
     assert stat_before.st_uid == stat_after.st_uid
-    assert stat_before.st_mode == stat_after.st_mode
-    # Next try to set the owner to another user (root)
-    #   This should throw a permissions error proving the code is called and the
-    #   previous step successfully "changed" the owner to the only owner this
-    #   user has permissions to change to.
-    with pytest.raises(PermissionError):
-        _set_permissions(test_file.absolute(), None, 0, None)
+    assert stat_before.st_gid == stat_after.st_gid
 
 
-def test_tries_set_group_when_given(tmp_path: pathlib.Path):
+@pytest.mark.parametrize(
+    'set_owner, set_group',
+    [(True, False), (False, True)],
+    ids=['owner', 'group'],
+)
+def test_tries_set_owner_or_group_when_given(
+    tmp_path: pathlib.Path, set_owner: bool, set_group: bool
+):
     test_file = tmp_path.joinpath('test.pem')
     test_file.write_text('')
-    # First try to set the group to the current user's group (aka current
-    #  group). This should be a noop and won't error out.
+    # First try to set the owner/group to the current user's (aka current
+    #  owner/group). This should be a noop and won't error out.
     stat_before = test_file.stat()
-    _set_permissions(test_file.absolute(), None, None, stat_before.st_gid)
+    _set_permissions(
+        test_file.absolute(),
+        None,
+        stat_before.st_uid if set_owner else None,
+        stat_before.st_gid if set_group else None,
+    )
     stat_after = test_file.stat()
     assert stat_before.st_gid == stat_after.st_gid
     assert stat_before.st_uid == stat_after.st_uid
     assert stat_before.st_mode == stat_after.st_mode
-    # Next try to set the group to another group (root)
+    # Next try to set the owner/group to another user/group (root)
     #   This should throw a permissions error proving the code is called and the
-    #   previous step successfully "changed" the group to the only group this
-    #   user has permissions to change to.
+    #   previous step successfully "changed" the owner/group to the only one
+    #   this user has permissions to change to.
     with pytest.raises(PermissionError):
-        _set_permissions(test_file.absolute(), None, None, 0)
+        _set_permissions(
+            test_file.absolute(),
+            None,
+            0 if set_owner else None,
+            0 if set_group else None,
+        )
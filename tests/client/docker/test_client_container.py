@@ -1,7 +1,6 @@
 """Tests for the full client docker container."""
 
 import pathlib
-import time
 from typing import Callable
 
 import pytest
@@ -47,11 +46,8 @@ def test_updates_other_container(
     )
     # Take the before measurement
     canned_started_at = canned.started_at
-    # Sleep just enough to ensure a definite difference
-    time.sleep(1)
     # start and wait for the container to be running and the client to be ready
     client.start(timeout=120)
-    time.sleep(10)
     server_context = mock_server_push(
         lineage_name='test.example.com',
         client_address=client.ipv4_address,
@@ -57,13 +57,13 @@ def test_daemon_runs_daemon(
     )
     assert thread.is_alive(), 'The client died too soon.'
     # Wait for the magic string to show up in the log
-    thread.wait_for_text_in_log(
+    has_started = thread.wait_for_text_in_file(
         RefMsgs.HAS_STARTED.log,
-        lambda _: client_log.read_bytes() if client_log.exists() else [],
+        client_log,
     )
     thread.reraise_unexpected()
     ## Verify the results
-    assert RefMsgs.HAS_STARTED.log in client_log.read_bytes()
+    assert has_started
 
 
 def test_no_args_runs_deploy(
@@ -174,17 +174,15 @@ def test_overrides_sftp_log_level_and_sftp_log_filename(
         kill_switch=kill_switch,
         teardown=kill_switch.teardown(DeployServer),
     )
-    thread.wait_for_text_in_log(
-        RefMsgs.HAS_STARTED.log, lambda x: client_log.read_bytes()
-    )
+    thread.wait_for_text_in_file(RefMsgs.HAS_STARTED.log, client_log)
     assert thread.is_alive(), 'The client died too soon.'
     mock_server.push()
-    thread.wait_for_text_in_log(
-        ParamikoMsgs.TRANSPORT_EMPTY.log, lambda x: final_log_path.read_bytes()
+    transport_empty = thread.wait_for_text_in_file(
+        ParamikoMsgs.TRANSPORT_EMPTY.log, final_log_path
     )
     thread.reraise_unexpected()
     ## Verify the result
-    assert ParamikoMsgs.TRANSPORT_EMPTY.log in final_log_path.read_bytes()
+    assert transport_empty
     paramiko_log = logging.getLogger(name=PARAMIKO_LOGGER_NAME)
     assert LogLevel.cast(paramiko_log.getEffectiveLevel()) == final_log_level
     assert paramiko_log.handlers[0].stream.name == str(final_log_path)
@@ -1,7 +1,5 @@
 """Tests for `certdeploy.client.update.update_docker_container`."""
 
-import time
-
 import pytest
 from fixtures.docker_container import ContainerStatus
 
@@ -24,8 +22,6 @@ def test_updates_docker_container_by_name(
     canned = canned_docker_container()
     # Take the before measurement
     started_at = canned.started_at
-    # Sleep just enough to ensure a definite difference
-    time.sleep(1)
     # Do the thing under test
     update_docker_container(
         DockerContainer({'name': canned.name}),
@@ -49,8 +45,6 @@ def test_updates_docker_container_by_filter(
     canned = canned_docker_container()
     # Take the before measurement
     started_at = canned.started_at
-    # Sleep just enough to ensure a definite difference
-    time.sleep(1)
     # Do the thing under test
     update_docker_container(
         DockerContainer({'filters': {'label': 'certdeploy_test'}}),
@@ -6,8 +6,9 @@ Read more about conftest.py under:
 """
 
 
-import pytest  # noqa: F401
+import pytest
 from fixtures.client_config import (  # noqa: F401
+    client_config_from_dict,
     tmp_client_config,
     tmp_client_config_file,
 )
@@ -42,3 +43,17 @@ from fixtures.utils import (  # noqa: F401
     tmp_script,
     wait_for_condition,
 )
+
+
+def pytest_configure(config: pytest.Config):
+    """Keep each module's tests on one pytest-xdist worker by default.
+
+    This applies `--dist loadfile` when tests are spread across workers with
+    `-n` and no `--dist` is given. It's done here instead of in `addopts` so
+    that pytest still runs without pytest-xdist installed.
+    """
+    if not getattr(config.option, 'numprocesses', None):
+        return
+    if any(arg.startswith('--dist') for arg in config.invocation_params.args):
+        return
+    config.option.dist = 'loadfile'
@@ -4,21 +4,20 @@ import pathlib
 from typing import Any, Callable
 
 import pytest
-import yaml
 from fixtures.keys import CLIENT_KEY_NAME, KeyPair
-from fixtures.utils import ConfigContext, get_free_port
+from fixtures.utils import ConfigContext, get_free_port, write_config
 
 from certdeploy.client.config import ClientConfig
 
 
-def client_config_file(
+def client_config_dict(
     tmp_path: pathlib.Path,
     client_keypair: KeyPair = None,
     server_keypair: KeyPair = None,
     sftpd: dict = None,
     **conf: Any,
-) -> ConfigContext:
-    """Finish configuring the temporary client config.
+) -> dict:
+    """Finish configuring the temporary client config `dict`.
 
     Arguments:
         tmp_path: Base directory for the config.
@@ -39,7 +38,6 @@ def client_config_file(
     src.mkdir()
     dest = tmp_path.joinpath('dest')
     dest.mkdir()
-    config_filename = tmp_path.joinpath('client.yml')
     # Non-default values for top level options
     config = dict(destination=str(dest), source=str(src), sftpd=sftpd or {})
     if sftpd is not None and sftpd != {}:
@@ -47,7 +45,41 @@ def client_config_file(
             tmp_path, client_keypair, server_keypair, **sftpd
         )
     config.update(conf)
-    yaml.safe_dump(config, config_filename.open('w'))
+    return config
+
+
+def client_config_file(
+    tmp_path: pathlib.Path,
+    client_keypair: KeyPair = None,
+    server_keypair: KeyPair = None,
+    sftpd: dict = None,
+    **conf: Any,
+) -> ConfigContext:
+    """Finish configuring the temporary client config.
+
+    Arguments:
+        tmp_path: Base directory for the config.
+        client_keypair: The CertDeploy client's key pair.
+        server_keypair: The CertDeploy server's key pair.
+        sftpd: The `sftpd` config option gets special treatment. See
+            `client_config_dict` for details.
+
+    Keyword Arguments:
+        conf: Key value pairs corresponding to
+            `certdeploy.client.config.client.Config` arguments.
+
+    Returns:
+        The client config with the given values or minimum values.
+    """
+    config = client_config_dict(
+        tmp_path,
+        client_keypair,
+        server_keypair,
+        sftpd,
+        **conf,
+    )
+    config_filename = tmp_path.joinpath('client.yml')
+    write_config(config_filename, config)
     return ConfigContext(
         config_filename,
         config,
@@ -56,6 +88,20 @@ def client_config_file(
     )
 
 
+def _test_client_config(**conf: Any) -> dict:
+    """Return non-default values for top level options updated with `conf`."""
+    config = dict(
+        sftpd={},
+        systemd_exec='test systemd_exec value',
+        systemd_timeout=42,
+        docker_url='test docker_url value',  # Use the local socket
+        update_services=[],
+        update_delay='11s',
+    )
+    config.update(conf)
+    return config
+
+
 def client_sftpd_config(
     tmp_path: pathlib.Path = None,
     client_keypair: KeyPair = None,
@@ -140,16 +186,7 @@ def tmp_client_config_file(
         tmp_path = tmp_path or tmp_path_factory.mktemp('tmp_client_config_file')
         client_keypair = client_keypair or keypairgen()
         server_keypair = server_keypair or keypairgen()
-        # Non-default values for top level options
-        config = dict(
-            sftpd={},
-            systemd_exec='test systemd_exec value',
-            systemd_timeout=42,
-            docker_url='test docker_url value',  # Use the local socket
-            update_services=[],
-            update_delay='11s',
-        )
-        config.update(conf)
+        config = _test_client_config(**conf)
         return client_config_file(
             tmp_path,
             client_keypair=client_keypair,
@@ -195,3 +232,52 @@ def tmp_client_config(
         return ClientConfig.load(config_context.config_path)
 
     return _tmp_client_config
+
+
+@pytest.fixture(scope='function')
+def client_config_from_dict(
+    tmp_path_factory: pytest.TempPathFactory, keypairgen: callable
+) -> Callable[[pathlib.Path, KeyPair, KeyPair, ...], ClientConfig]:
+    """Return a client config factory that doesn't write a config file.
+
+    This takes the same arguments as `tmp_client_config_file` but passes the
+    config `dict` straight to `ClientConfig` instead of writing it to a YAML
+    file and loading that.
+    """
+
+    def _client_config_from_dict(
+        tmp_path: pathlib.Path = None,
+        client_keypair: KeyPair = None,
+        server_keypair: KeyPair = None,
+        **conf: Any,
+    ) -> ClientConfig:
+        """Return a client config with the given values.
+
+        Arguments:
+            tmp_path: The temporary directory to use in this function. Defaults
+                to a freshly generated temporary directory.
+            client_keypair: The key pair for the CertDeploy client. Defaults to
+                a freshly generated key pair.
+            server_keypair: The key pair for the CertDeploy server. Defaults to
+                a freshly generated key pair.
+
+        Keyword Arguments:
+            conf: Key value pairs corresponding to
+                `certdeploy.client.config.client.Config` arguments.
+
+        Returns:
+            The client config with the given values.
+        """
+        tmp_path = tmp_path or tmp_path_factory.mktemp('config_from_dict')
+        client_keypair = client_keypair or keypairgen()
+        server_keypair = server_keypair or keypairgen()
+        return ClientConfig(
+            **client_config_dict(
+                tmp_path,
+                client_keypair=client_keypair,
+                server_keypair=server_keypair,
+                **_test_client_config(**conf),
+            )
+        )
+
+    return _client_config_from_dict
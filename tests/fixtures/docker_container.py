@@ -2,7 +2,6 @@
 
 import logging
 import pathlib
-import re
 import time
 from datetime import datetime
 from typing import Any, Callable
@@ -95,9 +94,12 @@ class ContainerWrapper:
         if self._container.status == ContainerStatus.CREATED:
             return None
         started_at = self._container.attrs['State']['StartedAt']
-        # Transform the time into a format datetime can handle.
-        cleaned = re.sub(r'\.[0-9]+Z', '', started_at)
-        return datetime.strptime(cleaned, '%Y-%m-%dT%H:%M:%S')
+        # Docker reports nanoseconds but datetime stops at microseconds. Keeping
+        #   the fraction means a restart never looks like the same start.
+        timestamp, _, fraction = started_at.rstrip('Z').partition('.')
+        return datetime.strptime(
+            f'{timestamp}.{fraction[:6] or 0}', '%Y-%m-%dT%H:%M:%S.%f'
+        )
 
     def create(
         self,
@@ -170,13 +170,18 @@ def _keypairgen(
     )
 
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope='session')
 def pubkeygen() -> Callable[[], str]:
-    """Return a public key string factory."""
+    """Return a public key string factory.
+
+    Key generation is the slow part so the key is generated once per session.
+    Tests that need distinct keys should use `keypairgen` instead.
+    """
+    pubkey_text = _keypairgen().pubkey_text
 
     def _pubkeygen() -> str:
-        """Return a freshly generated public key string."""
-        return _keypairgen().pubkey_text
+        """Return the session's public key string."""
+        return pubkey_text
 
     return _pubkeygen
 
@@ -63,6 +63,14 @@ class MockClientTCPServer(threading.Thread):
         self.stop()
         return self._log
 
+    @property
+    def access_count(self) -> int:
+        """The number of times the server has been accessed so far.
+
+        Unlike `log` this doesn't stop this mock client.
+        """
+        return len(self._log)
+
     def stop(self):
         """Stop the main loop and join the thread."""
         self._keep_serving = False
@@ -4,9 +4,8 @@ import pathlib
 from typing import Any, Callable
 
 import pytest
-import yaml
 from fixtures.keys import SERVER_KEY_NAME, KeyPair
-from fixtures.utils import ConfigContext
+from fixtures.utils import ConfigContext, write_config
 
 from certdeploy.server.config import ServerConfig
 
@@ -92,7 +91,7 @@ def server_config_file(
         queue_dir=str(queue_dir),
     )
     config.update(conf)
-    yaml.safe_dump(config, config_path.open('w'))
+    write_config(config_path, config)
     return ConfigContext(config_path, config, client_keypair, server_keypair)
 
 
@@ -154,6 +153,7 @@ def tmp_server_config_file(
             push_retries=11,
             push_retry_interval=41,
             join_timeout=371,
+            connect_timeout=13,
         )
         config.update(conf)
         return server_config_file(
@@ -5,6 +5,7 @@ noise in pytest.
 """
 
 import logging
+import pathlib
 import threading
 import time
 from typing import Any, Callable
@@ -88,7 +89,7 @@ class CleanThread(threading.Thread):
         #   parameters. Also the default shouldn't be to catch everything.
         self.allowed_exceptions = (_WontBeThrownException,)
         if allowed_exceptions:
-            self.allowed_exceptions = allowed_exceptions
+            self.allowed_exceptions = tuple(allowed_exceptions)
         self.kill_switch = kill_switch
         if self.kill_switch is None:
             self.kill_switch = KillSwitch()
@@ -189,6 +190,53 @@ class CleanThread(threading.Thread):
 
         return self.wait_for_condition(lambda x: _text_in_log(x), timeout)
 
+    def wait_for_text_in_file(
+        self,
+        text: bytes,
+        path: pathlib.Path,
+        timeout: int = 60,
+    ) -> bool:
+        """Wait for some `text` to appear in the file at `path`.
+
+        Only the bytes appended since the last check are read each time so
+        long logs aren't rescanned from the start on every tick.
+
+        Arguments:
+            text: The bytes to look for in the file.
+            path: The path of the (log) file to watch. It doesn't have to exist
+                yet.
+            timeout: The number of seconds to wait for the thread to finish.
+                Defaults to `60`.
+
+        Returns:
+            `True` if the condition was met.
+            `False` if the thread is dead.
+
+        Raises:
+            TimeoutError: When `timeout` seconds have passed and `text` has not
+                been found in the file.
+        """
+        position = 0
+        # Enough of the previous read to catch `text` split across reads
+        overlap = len(text) - 1
+        tail = b''
+
+        def _text_in_file(_):
+            nonlocal position, tail
+            try:
+                with path.open('rb') as log_file:
+                    log_file.seek(position)
+                    new = log_file.read()
+            except FileNotFoundError as err:
+                log.warning('wait_for_text_in_file: %s', str(err))
+                return False
+            position += len(new)
+            window = tail + new
+            tail = window[-overlap:] if overlap else b''
+            return text in window
+
+        return self.wait_for_condition(_text_in_file, timeout)
+
     def stop(self, timeout: int = None, reraise: bool = None):
         """Stop the code is `self.func` if `self.kill_switch` is attached.
 
@@ -1,5 +1,7 @@
 """Random small fixtures and utilities."""
 
+import json
+import os
 import pathlib
 import socket
 import stat
@@ -47,11 +49,16 @@ _MOCK_PEM = b'''\
 -----END CERTIFICATE-----'''
 
 
+# The number of ports each pytest-xdist worker has to itself before the
+#   ports one worker looks at overlap with the next worker's.
+_XDIST_WORKER_PORTS = 1000
+
+
 class NoFeePort(Exception):
     """A descriptive exception for when no free port is found."""
 
 
-@dataclass
+@dataclass(frozen=True)
 class ConfigContext:
     """A wrapper for important config generation related values."""
 
@@ -69,6 +76,13 @@ class ConfigContext:
         return iter((self.config_path, self.config))
 
 
+def write_config(config_path: pathlib.Path, config: dict):
+    """Write `config` to the YAML config file at `config_path`."""
+    # JSON is valid YAML and much faster to write and parse
+    with config_path.open('w') as config_file:
+        json.dump(config, config_file)
+
+
 class _Ports:
     """A registry of ports use in testing."""
 
@@ -255,7 +269,8 @@ def get_free_port(
     Note:
         This uses a global registry of selected ports so the previously
         discovered free ports don't have to be in use when selecting another
-        free port.
+        free port. The registry is per process so each pytest-xdist worker
+        starts looking at a different port.
 
     Arguments:
         min_port: The lowest acceptable port. Defaults to 1025.
@@ -268,7 +283,11 @@ def get_free_port(
     Raises:
        NoFreePort: When there are no unused ports in the given range.
     """
-    for port in range(min_port, max_port):
+    ports = range(min_port, max_port)
+    # `gw0`, `gw1`, ... when running under pytest-xdist
+    worker = os.environ.get('PYTEST_XDIST_WORKER', 'gw0')
+    start = (int(worker[2:]) * _XDIST_WORKER_PORTS) % len(ports)
+    for port in (*ports[start:], *ports[:start]):
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         try:
             sock.bind((address, port))
@@ -31,6 +31,7 @@ def test_loads_valid_server(
     assert config.push_retries == context.config['push_retries']
     assert config.push_retry_interval == context.config['push_retry_interval']
     assert config.join_timeout == context.config['join_timeout']
+    assert config.connect_timeout == context.config['connect_timeout']
     assert config.queue_dir == context.config['queue_dir']
     assert config.sftp_log_filename == context.config['sftp_log_filename']
     assert config.sftp_log_level == context.config['sftp_log_level']
@@ -99,6 +100,15 @@ def test_loads_valid_server_join_timeout_int(
     assert config.join_timeout == 1
 
 
+def test_loads_valid_server_connect_timeout_none(
+    tmp_server_config_file: Callable[[...], ConfigContext]
+):
+    """Verify that a valid `connect_timeout` (`None`) is accepted."""
+    context = tmp_server_config_file(connect_timeout=None)
+    config = ServerConfig.load(context.config_path)
+    assert config.connect_timeout is None
+
+
 def test_loads_valid_client(
     pubkeygen: Callable[[], str],
     tmp_server_config_file: Callable[[...], ConfigContext],
@@ -135,6 +145,7 @@ def test_loads_valid_client(
     assert client.needs_privkey == src_client['needs_privkey']
     assert client.push_retries == src_client['push_retries']
     assert client.push_retry_interval == src_client['push_retry_interval']
+    assert client.wanted_files == ('chain.pem',)
 
 
 def test_loads_valid_client_push_retries_none(
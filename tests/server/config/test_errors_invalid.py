@@ -174,3 +174,18 @@ def test_fails_invalid_join_timeout(
         bad_join_timeout,
     )
     assert error_value in str(err)
+
+
+def test_fails_invalid_connect_timeout(
+    tmp_server_config_file: Callable[[...], ConfigContext]
+):
+    """Verify an invalid `connect_timeout` causes an error."""
+    bad_connect_timeout = 0
+    context = tmp_server_config_file(connect_timeout=bad_connect_timeout)
+    with pytest.raises(ConfigError) as err:
+        ServerConfig.load(context.config_path)
+    error_value = ServerErrors.format_invalid_value(
+        'connect_timeout',
+        bad_connect_timeout,
+    )
+    assert error_value in str(err)
@@ -30,6 +30,7 @@ def test_help_shows_help():
     assert RefMsgs.HELP_TEXT_ALT.message in result.output
 
 
+@pytest.mark.slow
 def test_daemon_runs_daemon(
     log_file: pathlib.Path,
     managed_thread: Callable[[...], CleanThread],
@@ -54,12 +55,13 @@ def test_daemon_runs_daemon(
         teardown=kill_switch.teardown(Server),
     )
     # Wait for the magic string to show up in the log
-    thread.wait_for_text_in_log(
-        RefMsgs.DAEMON_HAS_STARTED.log, lambda x: log_file.read_bytes()
+    has_started = thread.wait_for_text_in_file(
+        RefMsgs.DAEMON_HAS_STARTED.log,
+        log_file,
     )
     thread.reraise_unexpected()
     ## Verify the results
-    assert RefMsgs.DAEMON_HAS_STARTED.log in log_file.read_bytes()
+    assert has_started
 
 
 @pytest.mark.slow
@@ -257,5 +259,6 @@ def test_push_lineage_and_domains_queues_and_pushes(
     )
     ## Verify the results
     assert results.exception is None
-    assert RefMsgs.ADD_TO_QUEUE_MESSAGE.log in log_file.read_bytes()
-    assert RefMsgs.PUSH_ONLY.log in log_file.read_bytes()
+    log_text = log_file.read_bytes()
+    assert RefMsgs.ADD_TO_QUEUE_MESSAGE.log in log_text
+    assert RefMsgs.PUSH_ONLY.log in log_text
@@ -7,6 +7,8 @@ import paramiko
 import pytest
 from fixtures.errors import ServerErrors
 from fixtures.mock_fail_client import MockClientTCPServer
+from fixtures.threading import CleanThread
+from fixtures.utils import KillSwitch
 
 from certdeploy.server.config import ServerConfig
 from certdeploy.server.server import PushMode, Server
@@ -119,3 +121,58 @@ def test_fail_fast_on_parallel_push(
     assert len(client0_server.log) == 1
     # Second client never gets a connection attempt
     assert len(client1_server.log) == 1
+
+
+def test_fail_fast_on_parallel_daemon_push(
+    client_conn_config_factory: Callable[[...], dict],
+    lineage_factory: Callable[[str, str, ...], pathlib.Path],
+    managed_thread: Callable[[...], CleanThread],
+    mock_fail_client: Callable[[...], MockClientTCPServer],
+    tmp_server_config: Callable[[...], ServerConfig],
+    wait_for_condition: Callable[[Callable[[], bool], int], None],
+):
+    """Verify that `fail_fast` ends the daemon without waiting on idle workers.
+
+    Parallel push workers in daemon mode wait for more lineages once they run
+    out. A worker with an error to report shouldn't.
+    """
+    ## Define some variables to avoid magic values
+    client_address = '127.0.0.1'
+    lineage_name = 'lineage.test'
+    # Well under `WORKER_IDLE_TIMEOUT`
+    max_seconds = 15
+    ## Setup client
+    client_server = mock_fail_client(client_address)
+    client_config = client_conn_config_factory(
+        address=client_server.address,
+        port=client_server.port,
+        domains=[lineage_name],
+    )
+    ## Setup server
+    server_config = tmp_server_config(
+        client_configs=[client_config],
+        fail_fast=True,
+        push_mode=PushMode.PARALLEL.value,
+        push_retries=0,
+    )
+    ## Setup the lineage
+    # The filename doesn't matter because it will never get far enough to
+    #   matter.
+    lineage_path = str(lineage_factory(lineage_name, ['doesnotmatter.pem']))
+    ## Setup test
+    server = Server(server_config)
+    server.sync(lineage_path, [lineage_name])
+    kill_switch = KillSwitch()
+    server._stop_running = kill_switch
+    ## Run test
+    thread = managed_thread(
+        server.serve_forever,
+        allowed_exceptions=[paramiko.ssh_exception.SSHException],
+        kill_switch=kill_switch,
+        teardown=kill_switch.teardown(server),
+    )
+    wait_for_condition(lambda: not thread.is_alive(), max_seconds)
+    ## Verify the results
+    thread.reraise_unexpected()
+    assert ServerErrors.SSH_BANNER_ERROR in str(thread.expected_exception)
+    assert len(client_server.log) == 1
@@ -3,6 +3,7 @@
 import pathlib
 from typing import Callable
 
+import pytest
 from fixtures.mock_fail_client import MockClientTCPServer
 
 from certdeploy.server.config import ServerConfig
@@ -12,6 +13,7 @@ from certdeploy.server.server import Server
 MAX_SECONDS_OFF = 1
 
 
+@pytest.mark.slow
 def test_push_mode_serial_pushes_one_at_a_time(
     client_conn_config_factory: Callable[[...], dict],
     lineage_factory: Callable[[str, str, ...], pathlib.Path],
@@ -0,0 +1,41 @@
+"""Tests for loading the server's private key only when pushing."""
+
+import pathlib
+from typing import Callable
+
+import pytest
+
+from certdeploy.errors import ConfigError
+from certdeploy.server.config import ServerConfig
+from certdeploy.server.server import Queue, Server
+
+LINEAGE_NAME = 'lineage.test'
+
+
+def test_sync_does_not_need_privkey(
+    client_conn_config_factory: Callable[[...], dict],
+    tmp_path: pathlib.Path,
+    tmp_server_config: Callable[[...], ServerConfig],
+):
+    """Verify lineages are queued even if the private key can't be read."""
+    client_config = client_conn_config_factory(domains=[LINEAGE_NAME])
+    server_config = tmp_server_config(client_configs=[client_config])
+    bad_privkey = tmp_path.joinpath('bad_privkey')
+    bad_privkey.write_text('not a private key')
+    server_config.privkey_filename = str(bad_privkey)
+    server = Server(server_config)
+    server.sync('/lineage/a', [LINEAGE_NAME])
+    (client,) = server_config.clients
+    assert list(Queue(server_config, 'r').load().get(client.hash)) == [
+        '/lineage/a'
+    ]
+    with pytest.raises(ConfigError, match='privkey_filename'):
+        server.privkey
+
+
+def test_privkey_is_parsed_once(
+    tmp_server_config: Callable[[...], ServerConfig],
+):
+    """Verify the private key is parsed on first use and then reused."""
+    server = Server(tmp_server_config())
+    assert server.privkey is server.privkey
@@ -0,0 +1,170 @@
+"""Tests for waking idle push workers and stopping them."""
+
+import pathlib
+from typing import Callable
+
+import pytest
+from fixtures.mock_fail_client import MockClientTCPServer
+from fixtures.threading import CleanThread
+from fixtures.utils import KillSwitch
+
+from certdeploy.server import server as server_module
+from certdeploy.server.config import ServerConfig
+from certdeploy.server.config.server import PushMode
+from certdeploy.server.server import PushWorker, Queue, Server
+
+CLIENT_ADDRESS = '127.0.0.1'
+LINEAGE_NAME = 'lineage.test'
+# Much longer than any of these tests should take
+IDLE_TIMEOUT = 60
+
+
+@pytest.fixture()
+def push_setup(
+    client_conn_config_factory: Callable[[...], dict],
+    lineage_factory: Callable[[str, str, ...], pathlib.Path],
+    mock_fail_client: Callable[[...], MockClientTCPServer],
+    tmp_server_config: Callable[[...], ServerConfig],
+) -> tuple[MockClientTCPServer, Server, str]:
+    """Return a mock client, a parallel push server, and a lineage path."""
+    mock_client = mock_fail_client(CLIENT_ADDRESS)
+    client_config = client_conn_config_factory(
+        address=mock_client.address,
+        port=mock_client.port,
+        domains=[LINEAGE_NAME],
+    )
+    server_config = tmp_server_config(
+        client_configs=[client_config],
+        push_mode=PushMode.PARALLEL.value,
+        push_retries=0,
+    )
+    # The filename doesn't matter because it will never get far enough to
+    #   matter.
+    lineage_path = str(lineage_factory(LINEAGE_NAME, ['doesnotmatter.pem']))
+    return mock_client, Server(server_config), lineage_path
+
+
+def _queued(server: Server) -> list[str]:
+    """Return the lineages queued on disk for the only client."""
+    (client,) = server._config.clients
+    return list(Queue(server._config, 'r').load().get(client.hash, []))
+
+
+def test_woken_worker_pushes_newly_queued_lineages(
+    push_setup: tuple[MockClientTCPServer, Server, str],
+    wait_for_condition: Callable[[Callable[[], bool], int], None],
+):
+    """Verify an idle worker pushes lineages queued before it's woken up."""
+    mock_client, server, lineage_path = push_setup
+    (client,) = server._config.clients
+    server.sync(lineage_path, [LINEAGE_NAME])
+    worker = PushWorker(server, client, server._config, IDLE_TIMEOUT)
+    worker.start()
+    wait_for_condition(lambda: worker.is_idle, 10)
+    assert mock_client.access_count == 1
+    assert _queued(server) == []
+    ## Queue another lineage and wake the idle worker
+    server.sync(lineage_path, [LINEAGE_NAME])
+    assert worker.wake()
+    wait_for_condition(lambda: mock_client.access_count == 2, 10)
+    ## Stopping wakes the idle worker right away
+    wait_for_condition(lambda: worker.is_idle, 10)
+    worker.stop()
+    worker.join(1)
+    assert not worker.is_alive()
+    assert not worker.wake()
+    assert len(mock_client.log) == 2
+
+
+def test_worker_ends_when_idle_timeout_runs_out(
+    push_setup: tuple[MockClientTCPServer, Server, str],
+):
+    """Verify a worker stops checking the queue once its idle timeout is up."""
+    mock_client, server, lineage_path = push_setup
+    (client,) = server._config.clients
+    server.sync(lineage_path, [LINEAGE_NAME])
+    worker = PushWorker(server, client, server._config, 0.1)
+    worker.start()
+    worker.join(10)
+    assert not worker.is_alive()
+    assert not worker.wake()
+    assert len(mock_client.log) == 1
+
+
+def test_lineage_stays_queued_until_given_up_on(
+    push_setup: tuple[MockClientTCPServer, Server, str],
+    wait_for_condition: Callable[[Callable[[], bool], int], None],
+):
+    """Verify a lineage is only removed from the queue after its last try."""
+    mock_client, server, lineage_path = push_setup
+    (client,) = server._config.clients
+    server.sync(lineage_path, [LINEAGE_NAME])
+    worker = PushWorker(server, client, server._config)
+    # Leave time between tries to look at the queue
+    worker._retries = 1
+    worker._retry_interval = 1
+    worker.start()
+    wait_for_condition(lambda: mock_client.access_count == 1, 10)
+    assert _queued(server) == [lineage_path]
+    worker.join(10)
+    assert not worker.is_alive()
+    assert _queued(server) == []
+    assert len(mock_client.log) == 2
+
+
+def test_stopped_worker_leaves_lineages_queued(
+    push_setup: tuple[MockClientTCPServer, Server, str],
+):
+    """Verify lineages a stopped worker didn't get to stay in the queue."""
+    mock_client, server, lineage_path = push_setup
+    (client,) = server._config.clients
+    server.sync(lineage_path, [LINEAGE_NAME])
+    server.sync(lineage_path, [LINEAGE_NAME])
+    worker = PushWorker(server, client, server._config, IDLE_TIMEOUT)
+    worker.stop()
+    worker.start()
+    worker.join(1)
+    assert not worker.is_alive()
+    assert _queued(server) == [lineage_path, lineage_path]
+    assert len(mock_client.log) == 0
+
+
+def test_daemon_reuses_idle_worker_and_stops_it(
+    managed_thread: Callable[[...], CleanThread],
+    monkeypatch: pytest.MonkeyPatch,
+    push_setup: tuple[MockClientTCPServer, Server, str],
+    wait_for_condition: Callable[[Callable[[], bool], int], None],
+):
+    """Verify the daemon wakes an idle worker for newly queued lineages.
+
+    Also verify the idle worker doesn't keep the main loop busy and that it's
+    stopped when the daemon stops.
+    """
+    # Don't let the main loop's slow down stretch out the test
+    monkeypatch.setattr(server_module, 'SLOW_DOWN_SLEEP', 0.5)
+    mock_client, server, lineage_path = push_setup
+    kill_switch = KillSwitch()
+    server._stop_running = kill_switch
+    thread = managed_thread(
+        server.serve_forever,
+        kill_switch=kill_switch,
+        teardown=kill_switch.teardown(server),
+    )
+    server.sync(lineage_path, [LINEAGE_NAME])
+    wait_for_condition(lambda: mock_client.access_count == 1, 10)
+    wait_for_condition(
+        lambda: [w.is_idle for w in server._workers.values()] == [True], 10
+    )
+    (worker,) = server._workers.values()
+    ## Queue another lineage for the same client
+    server.sync(lineage_path, [LINEAGE_NAME])
+    wait_for_condition(lambda: mock_client.access_count == 2, 10)
+    assert list(server._workers.values()) == [worker]
+    ## Stop the daemon once the worker is waiting for more lineages
+    wait_for_condition(lambda: worker.is_idle, 10)
+    thread.stop(timeout=5)
+    thread.reraise_unexpected()
+    assert not thread.is_alive()
+    worker.join(1)
+    assert not worker.is_alive()
+    assert _queued(server) == []
@@ -0,0 +1,79 @@
+"""Tests for skipping reloads of an unchanged queue."""
+
+import os
+import time
+from typing import Callable
+
+import pytest
+
+from certdeploy.server.config import ServerConfig
+from certdeploy.server.server import Queue
+
+CLIENT0 = 'client0hash'
+CLIENT1 = 'client1hash'
+
+
+def _age_queue_dir(config: ServerConfig):
+    """Set the modification time of `queue_dir` well into the past.
+
+    Changes made within the filesystem's timestamp resolution of a load are
+    always reloaded so the queue has to look older than that to be cached.
+    """
+    past = time.time() - 60
+    os.utime(config.queue_dir, (past, past))
+
+
+@pytest.fixture()
+def read_counter(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Return a `list` of the queue files read by `Queue` as they're read."""
+    reads = []
+    original_read = Queue._read
+
+    def _counting_read(filename, expected_type):
+        reads.append(filename)
+        return original_read(filename, expected_type)
+
+    monkeypatch.setattr(Queue, '_read', staticmethod(_counting_read))
+    return reads
+
+
+def test_unchanged_queue_is_not_reloaded(
+    monkeypatch: pytest.MonkeyPatch,
+    read_counter: list[str],
+    tmp_server_config: Callable[..., ServerConfig],
+):
+    """Verify loading an unchanged queue again doesn't read it from disk."""
+    config = tmp_server_config()
+    with Queue(config, 'w') as queue:
+        queue.append(CLIENT0, '/lineage/a')
+    _age_queue_dir(config)
+    queue = Queue(config, 'r')
+    assert queue.load().count(CLIENT0) == 1
+    assert len(read_counter) == 1
+    listed = []
+    original_listdir = os.listdir
+
+    def _counting_listdir(path):
+        listed.append(path)
+        return original_listdir(path)
+
+    monkeypatch.setattr(os, 'listdir', _counting_listdir)
+    assert queue.load().count(CLIENT0) == 1
+    assert listed == []
+    assert len(read_counter) == 1
+
+
+def test_changed_queue_is_reloaded(
+    tmp_server_config: Callable[..., ServerConfig],
+):
+    """Verify loading a queue again picks up changes made since."""
+    config = tmp_server_config()
+    with Queue(config, 'w') as queue:
+        queue.append(CLIENT0, '/lineage/a')
+    _age_queue_dir(config)
+    queue = Queue(config, 'r')
+    assert queue.load().clients == [CLIENT0]
+    with Queue(config, 'w') as writable_queue:
+        writable_queue.append(CLIENT1, '/lineage/b')
+    assert sorted(queue.load().clients) == sorted([CLIENT0, CLIENT1])
+    assert list(queue.get(CLIENT1)) == ['/lineage/b']
@@ -0,0 +1,126 @@
+"""Tests for the per client queue files and the legacy queue file."""
+
+import json
+import pathlib
+from typing import Callable
+
+from certdeploy.server.config import ServerConfig
+from certdeploy.server.server import Queue
+
+CLIENT0 = 'client0hash'
+CLIENT1 = 'client1hash'
+LEGACY_QUEUE_FILENAME = 'queue.json'
+
+
+def _shard(config: ServerConfig, client_hash: str) -> pathlib.Path:
+    """Return the path of the queue file for `client_hash`."""
+    return pathlib.Path(config.queue_dir, f'{client_hash}.queue.json')
+
+
+def test_writes_one_file_per_client(
+    tmp_server_config: Callable[..., ServerConfig],
+):
+    """Verify each client's lineages are written to their own file."""
+    config = tmp_server_config()
+    with Queue(config, 'w') as queue:
+        queue.append(CLIENT0, '/lineage/a')
+        queue.append(CLIENT0, '/lineage/b')
+        queue.append(CLIENT1, '/lineage/c')
+    assert json.loads(_shard(config, CLIENT0).read_text()) == [
+        '/lineage/a',
+        '/lineage/b',
+    ]
+    assert json.loads(_shard(config, CLIENT1).read_text()) == ['/lineage/c']
+    assert not pathlib.Path(config.queue_dir, LEGACY_QUEUE_FILENAME).exists()
+
+
+def test_reads_client_queues(tmp_server_config: Callable[..., ServerConfig]):
+    """Verify a reader sees what a writer queued."""
+    config = tmp_server_config()
+    with Queue(config, 'w') as queue:
+        queue.append(CLIENT0, '/lineage/a')
+        queue.append(CLIENT1, '/lineage/b')
+        queue.append(CLIENT1, '/lineage/c')
+    queue = Queue(config, 'r').load()
+    assert sorted(queue.clients) == sorted([CLIENT0, CLIENT1])
+    assert queue.count(CLIENT0) == 1
+    assert list(queue.get(CLIENT1)) == ['/lineage/b', '/lineage/c']
+
+
+def test_removes_empty_client_file(
+    tmp_server_config: Callable[..., ServerConfig],
+):
+    """Verify a client's queue file is removed once its queue is empty."""
+    config = tmp_server_config()
+    with Queue(config, 'w') as queue:
+        queue.append(CLIENT0, '/lineage/a')
+    with Queue(config, 'w') as queue:
+        assert queue.next(CLIENT0) == '/lineage/a'
+        assert queue.next(CLIENT0) is None
+    assert not _shard(config, CLIENT0).exists()
+    assert len(Queue(config, 'r').load()) == 0
+
+
+def test_missing_client_file_reads_as_empty(
+    tmp_server_config: Callable[..., ServerConfig],
+):
+    """Verify a client's queue emptied after a reader loaded reads as empty.
+
+    Readers read the client queue files lazily after the lock is released so a
+    writer can remove a file in between.
+    """
+    config = tmp_server_config()
+    with Queue(config, 'w') as queue:
+        queue.append(CLIENT0, '/lineage/a')
+    reader = Queue(config, 'r').load()
+    assert CLIENT0 in reader
+    # Drain the client's queue after the reader has loaded
+    with Queue(config, 'w') as queue:
+        queue.next(CLIENT0)
+    assert reader.count(CLIENT0) == 0
+    assert reader.get(CLIENT0, 'default') == 'default'
+    assert CLIENT0 not in reader
+
+
+def test_migrates_legacy_queue_file(
+    tmp_server_config: Callable[..., ServerConfig],
+):
+    """Verify the single queue file from older versions is split by client."""
+    config = tmp_server_config()
+    legacy_file = pathlib.Path(config.queue_dir, LEGACY_QUEUE_FILENAME)
+    legacy_file.write_text(
+        json.dumps({CLIENT0: ['/lineage/a'], CLIENT1: ['/lineage/b']})
+    )
+    # Readers see the legacy queue without changing it
+    reader = Queue(config, 'r').load()
+    assert list(reader.get(CLIENT0)) == ['/lineage/a']
+    assert list(reader.get(CLIENT1)) == ['/lineage/b']
+    assert legacy_file.exists()
+    # Writers replace it with the per client files
+    with Queue(config, 'w'):
+        pass
+    assert not legacy_file.exists()
+    assert json.loads(_shard(config, CLIENT0).read_text()) == ['/lineage/a']
+    assert json.loads(_shard(config, CLIENT1).read_text()) == ['/lineage/b']
+
+
+def test_merges_partially_migrated_queue(
+    tmp_server_config: Callable[..., ServerConfig],
+):
+    """Verify the legacy queue file is merged into existing client files."""
+    config = tmp_server_config()
+    with Queue(config, 'w') as queue:
+        queue.append(CLIENT0, '/lineage/new')
+    legacy_file = pathlib.Path(config.queue_dir, LEGACY_QUEUE_FILENAME)
+    legacy_file.write_text(
+        json.dumps({CLIENT0: ['/lineage/old'], CLIENT1: ['/lineage/b']})
+    )
+    with Queue(config, 'w') as queue:
+        assert list(queue.get(CLIENT0)) == ['/lineage/new', '/lineage/old']
+        assert list(queue.get(CLIENT1)) == ['/lineage/b']
+    assert not legacy_file.exists()
+    assert json.loads(_shard(config, CLIENT0).read_text()) == [
+        '/lineage/new',
+        '/lineage/old',
+    ]
+    assert json.loads(_shard(config, CLIENT1).read_text()) == ['/lineage/b']